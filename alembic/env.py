@@ -29,6 +29,8 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 from app.db.session import Base
 from app.models.audit import Audit  # noqa
+from app.models.dashboard_callback import DashboardCallback  # noqa
+from app.models.link_check_cache import LinkCheckCache  # noqa
 
 target_metadata = Base.metadata
 
@@ -0,0 +1,46 @@
+"""convert audits.report_json to JSONB
+
+Revision ID: 002_report_json_jsonb
+Revises: 001_initial
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_report_json_jsonb"
+down_revision: Union[str, None] = "001_initial"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ### JSONB is required for in-place patching of the report (jsonb_set, ||) ###
+    op.alter_column(
+        "audits",
+        "report_json",
+        existing_type=sa.JSON(),
+        type_=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="report_json::jsonb",
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    # ### Revert report_json to plain JSON ###
+    op.alter_column(
+        "audits",
+        "report_json",
+        existing_type=postgresql.JSONB(),
+        type_=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="report_json::json",
+    )
+    # ### end Alembic commands ###
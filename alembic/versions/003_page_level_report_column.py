@@ -0,0 +1,51 @@
+"""move page_level_report into its own column
+
+Revision ID: 003_page_level_report
+Revises: 002_report_json_jsonb
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_page_level_report"
+down_revision: Union[str, None] = "002_report_json_jsonb"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ### Add page_level_report column and move existing data out of report_json ###
+    op.add_column(
+        "audits",
+        sa.Column("page_level_report", postgresql.JSONB(), nullable=True),
+    )
+    op.execute(
+        """
+        UPDATE audits
+        SET page_level_report = report_json -> 'page_level_report',
+            report_json = report_json - 'page_level_report'
+        WHERE report_json ? 'page_level_report'
+        """
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    # ### Fold page_level_report back into report_json and drop the column ###
+    op.execute(
+        """
+        UPDATE audits
+        SET report_json = report_json
+            || jsonb_build_object('page_level_report', page_level_report)
+        WHERE page_level_report IS NOT NULL AND report_json IS NOT NULL
+        """
+    )
+    op.drop_column("audits", "page_level_report")
+    # ### end Alembic commands ###
@@ -0,0 +1,67 @@
+"""add dashboard_callbacks table
+
+Revision ID: 004_dashboard_callbacks
+Revises: 003_page_level_report
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_dashboard_callbacks"
+down_revision: Union[str, None] = "003_page_level_report"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ### Outbox of dashboard callbacks, swept by the retry beat task ###
+    op.create_table(
+        "dashboard_callbacks",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("audit_id", sa.Integer(), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("last_error", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["audit_id"], ["audits.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_dashboard_callbacks_id"), "dashboard_callbacks", ["id"], unique=False
+    )
+    op.create_index(
+        op.f("ix_dashboard_callbacks_audit_id"),
+        "dashboard_callbacks",
+        ["audit_id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_dashboard_callbacks_status_next_attempt_at",
+        "dashboard_callbacks",
+        ["status", "next_attempt_at"],
+        unique=False,
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    # ### Drop the dashboard_callbacks table ###
+    op.drop_index(
+        "ix_dashboard_callbacks_status_next_attempt_at",
+        table_name="dashboard_callbacks",
+    )
+    op.drop_index(
+        op.f("ix_dashboard_callbacks_audit_id"), table_name="dashboard_callbacks"
+    )
+    op.drop_index(op.f("ix_dashboard_callbacks_id"), table_name="dashboard_callbacks")
+    op.drop_table("dashboard_callbacks")
+    # ### end Alembic commands ###
@@ -0,0 +1,39 @@
+"""add link_check_cache table
+
+Revision ID: 005_link_check_cache
+Revises: 004_dashboard_callbacks
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_link_check_cache"
+down_revision: Union[str, None] = "004_dashboard_callbacks"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # ### External link check results shared across audits ###
+    op.create_table(
+        "link_check_cache",
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("status", sa.Integer(), nullable=False),
+        sa.Column("etag", sa.String(), nullable=True),
+        sa.Column("last_modified", sa.String(), nullable=True),
+        sa.Column("checked_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("url"),
+    )
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    # ### Drop the link_check_cache table ###
+    op.drop_table("link_check_cache")
+    # ### end Alembic commands ###
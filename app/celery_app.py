@@ -1,9 +1,16 @@
 # IMPORTANT: This import is no longer needed.
 # import app.utils.serialization
 
+import logging
+
 from celery import Celery
+from celery.signals import worker_process_shutdown
+from kombu import Queue
 
 from app.core.config import settings
+from app.utils.logging_manager import logging_manager
+
+logger = logging.getLogger(__name__)
 
 # Create the Celery application instance
 # The `include` argument is a list of modules to import when the worker starts.
@@ -13,13 +20,48 @@ celery_app = Celery("seo_audit_agent", include=["app.tasks.orchestrator"])
 # Load configuration directly from our Pydantic settings object.
 celery_app.conf.update(settings.model_dump())
 
+# Dashboard callbacks are quick HTTP POSTs; on their own queue they aren't
+# stuck behind crawls that take minutes. Exact task names take precedence over
+# the wildcard routes in settings.
+CALLBACK_TASKS = (
+    "app.tasks.orchestrator.send_report_to_dashboard",
+    "app.tasks.orchestrator.retry_dashboard_callbacks",
+)
+
 # Explicitly configure queue routing to prevent interference
 celery_app.conf.update(
     task_default_queue=settings.CELERY_QUEUE_NAME,
-    task_routes=settings.task_routes,
+    # A worker started without -Q consumes both queues
+    task_queues=(
+        Queue(settings.CELERY_QUEUE_NAME),
+        Queue(settings.CELERY_CALLBACK_QUEUE_NAME),
+    ),
+    task_routes={
+        **settings.task_routes,
+        **{
+            name: {"queue": settings.CELERY_CALLBACK_QUEUE_NAME}
+            for name in CALLBACK_TASKS
+        },
+    },
 )
 
+# Periodic tasks, run by `celery beat`
+celery_app.conf.beat_schedule = {
+    # Redeliver dashboard callbacks whose earlier POST failed
+    "retry-dashboard-callbacks": {
+        "task": "app.tasks.orchestrator.retry_dashboard_callbacks",
+        "schedule": 60.0,
+    },
+}
+
+
+@worker_process_shutdown.connect
+def _flush_logs(**kwargs):
+    # Prefork children exit without running atexit; write out queued log
+    # records first
+    logging_manager.shutdown()
+
 
 @celery_app.task(bind=True)
 def debug_task(self):
-    print(f"Request: {self.request!r}")
+    logger.debug("Request: %r", self.request)
@@ -29,14 +29,36 @@ class Settings(BaseSettings):
 
     # Celery Queue Configuration (prevents interference with other workers)
     CELERY_QUEUE_NAME: str = Field("seo_audit_queue", alias="CELERY_QUEUE_NAME")
+    # Dashboard callbacks get their own queue so they don't wait behind crawls
+    CELERY_CALLBACK_QUEUE_NAME: str = Field(
+        "seo_audit_callbacks", alias="CELERY_CALLBACK_QUEUE_NAME"
+    )
 
     # Results file storage configuration
     SAVE_RESULTS_TO_DISK: bool = Field(False, alias="SAVE_RESULTS_TO_DISK")
 
+    # Source address for external link checks; "0.0.0.0" restricts them to
+    # IPv4. Unset, both IPv4 and IPv6 hosts are reachable.
+    LINK_CHECK_LOCAL_ADDRESS: Optional[str] = Field(
+        None, alias="LINK_CHECK_LOCAL_ADDRESS"
+    )
+
     # Lowercase Celery settings for modern configuration
-    task_serializer: str = "json"
-    result_serializer: str = "json"
-    accept_content: list[str] = ["json"]
+    # msgpack keeps the report and link lists passed along the chain smaller and
+    # faster to encode than JSON; JSON is still accepted for messages queued
+    # before the switch.
+    task_serializer: str = "msgpack"
+    result_serializer: str = "msgpack"
+    accept_content: list[str] = ["msgpack", "json"]
+    # The chain messages carry the compiled report and the external link list,
+    # which run to hundreds of KB for large sites; zstd shrinks them on the
+    # broker at little CPU cost.
+    task_compression: str = "zstd"
+
+    # Crawls run for minutes, so a worker process should only reserve the
+    # message it is working on; otherwise queued audits sit in a busy
+    # process's prefetch buffer while other processes are idle.
+    worker_prefetch_multiplier: int = 1
 
     # Queue configuration - use our dedicated queue
     task_default_queue: str = "seo_audit_queue"
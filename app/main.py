@@ -7,9 +7,17 @@ from pydantic import BaseModel, Field, HttpUrl
 from sqlalchemy.orm import Session
 
 from app.api.dependencies import get_api_key
+from app.celery_app import celery_app
 from app.db.session import Base, engine, get_db
 from app.models.audit import Audit
-from app.tasks.orchestrator import run_full_audit
+
+# Registered on Base.metadata for create_all below
+from app.models.dashboard_callback import DashboardCallback  # noqa
+from app.models.link_check_cache import LinkCheckCache  # noqa
+
+# Tasks are enqueued by name so the API process doesn't import the
+# orchestrator and everything it pulls in just to publish a message.
+RUN_FULL_AUDIT_TASK = "app.tasks.orchestrator.run_full_audit"
 
 # Load environment variables from .env file
 load_dotenv()
@@ -52,7 +60,7 @@ class AuditResultResponse(BaseModel):
     completed_at: Optional[datetime.datetime]
     error_message: Optional[str] = None
     technical_error: Optional[str] = None
-    report_json: Optional[Any] = None
+    report_json: Optional[Any] = Field(None, validation_alias="full_report_json")
 
     class Config:
         from_attributes = True
@@ -101,8 +109,13 @@ async def start_new_audit(
     db.refresh(new_audit)
 
     # 2. Launch the background task with the new audit ID and max_pages
-    task = run_full_audit.delay(
-        audit_id=new_audit.id, url=url_str, max_pages=request.max_pages
+    task = celery_app.send_task(
+        RUN_FULL_AUDIT_TASK,
+        kwargs={
+            "audit_id": new_audit.id,
+            "url": url_str,
+            "max_pages": request.max_pages,
+        },
     )
 
     return {"audit_id": new_audit.id, "task_id": task.id, "status": "PENDING"}
@@ -118,11 +131,11 @@ async def get_audit_result(
     This provides the full report for a completed audit, or the current
     status for an audit in progress.
     """
-    audit_record = db.query(Audit).filter(Audit.id == audit_id).first()
+    audit_record = db.get(Audit, audit_id)
     if not audit_record:
         raise HTTPException(status_code=404, detail="Audit not found")
 
     # By using a response_model with from_attributes=True, we can return
     # the SQLAlchemy model directly. Pydantic will handle mapping the
-    # `audit_record.report_json` to the `report` field in the response model.
+    # `audit_record.full_report_json` to the `report_json` field in the response model.
     return audit_record
@@ -1,6 +1,7 @@
 import datetime
 
-from sqlalchemy import JSON, Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy.dialects.postgresql import JSONB
 
 from app.db.session import Base
 
@@ -11,7 +12,10 @@ class Audit(Base):
     id = Column(Integer, primary_key=True, index=True)
     url = Column(String, index=True, nullable=False)
     status = Column(String, default="PENDING", nullable=False)
-    report_json = Column(JSON, nullable=True)
+    report_json = Column(JSONB, nullable=True)
+    # Per-page checks are kept out of report_json so that updates to the report
+    # don't rewrite them; they are folded back in by `full_report_json`.
+    page_level_report = Column(JSONB, nullable=True)
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     completed_at = Column(DateTime, nullable=True)
 
@@ -23,5 +27,12 @@ class Audit(Base):
     error_message = Column(String, nullable=True)  # User-friendly error message
     technical_error = Column(String, nullable=True)  # Technical error details
 
+    @property
+    def full_report_json(self):
+        """The report as exposed by the API, with page_level_report folded back in."""
+        if self.report_json is None or self.page_level_report is None:
+            return self.report_json
+        return {**self.report_json, "page_level_report": self.page_level_report}
+
     def __repr__(self):
         return f"<Audit(id={self.id}, url='{self.url}', status='{self.status}')>"
@@ -0,0 +1,29 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, LargeBinary, String
+
+from app.db.session import Base
+
+
+class DashboardCallback(Base):
+    __tablename__ = "dashboard_callbacks"
+
+    id = Column(Integer, primary_key=True, index=True)
+    audit_id = Column(Integer, ForeignKey("audits.id"), nullable=False, index=True)
+    # JSON body serialized once when the callback is queued and re-sent as-is
+    # on every attempt (Postgres compresses large values on its own).
+    payload = Column(LargeBinary, nullable=False)
+    status = Column(String, default="PENDING", nullable=False)  # PENDING, DELIVERED, FAILED
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    delivered_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        # Serves the retry sweep: pending rows ordered by due time
+        Index("ix_dashboard_callbacks_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    def __repr__(self):
+        return f"<DashboardCallback(id={self.id}, audit_id={self.audit_id}, status='{self.status}')>"
@@ -0,0 +1,20 @@
+import datetime
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.db.session import Base
+
+
+class LinkCheckCache(Base):
+    __tablename__ = "link_check_cache"
+
+    url = Column(String, primary_key=True)
+    status = Column(Integer, nullable=False)
+    # Validators from the last response, sent back as a conditional request
+    # once the entry expires
+    etag = Column(String, nullable=True)
+    last_modified = Column(String, nullable=True)
+    checked_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<LinkCheckCache(url='{self.url}', status={self.status})>"
@@ -0,0 +1,103 @@
+import datetime
+
+from sqlalchemy.dialects.postgresql import insert
+
+from app.db.session import SessionLocal
+from app.models.link_check_cache import LinkCheckCache
+from app.utils.logging_manager import logging_manager
+
+# How long a cached result is trusted without asking the server again
+TTL_OK_SECONDS = 86400  # 2xx/3xx
+TTL_CLIENT_ERROR_SECONDS = 3600  # 4xx
+
+
+def _ttl_for_status(status: int) -> int:
+    """Cache lifetime for a status; 0 means the result is not cached."""
+    if 200 <= status < 400:
+        return TTL_OK_SECONDS
+    if 400 <= status < 500:
+        return TTL_CLIENT_ERROR_SECONDS
+    # Server errors and unreachable links are usually transient
+    return 0
+
+
+def lookup(urls: list) -> tuple[dict, dict]:
+    """
+    Look up previously checked URLs.
+
+    Returns `(fresh, stale)`: `fresh` maps URLs whose entry is still within its
+    TTL to the cached status; `stale` maps expired URLs that have validators to
+    `{"status", "etag", "last_modified"}` for a conditional request.
+    """
+    fresh, stale = {}, {}
+    if not urls:
+        return fresh, stale
+
+    now = datetime.datetime.utcnow()
+    db = SessionLocal()
+    try:
+        entries = (
+            db.query(LinkCheckCache).filter(LinkCheckCache.url.in_(urls)).all()
+        )
+        for entry in entries:
+            age = (now - entry.checked_at).total_seconds()
+            if age < _ttl_for_status(entry.status):
+                fresh[entry.url] = entry.status
+            elif entry.etag or entry.last_modified:
+                stale[entry.url] = {
+                    "status": entry.status,
+                    "etag": entry.etag,
+                    "last_modified": entry.last_modified,
+                }
+    except Exception as e:
+        # The cache is an optimization; a failure just means everything is re-checked
+        logging_manager.log_system_event(
+            "crawler", "warning", f"Link cache lookup failed: {e}"
+        )
+        return {}, {}
+    finally:
+        db.close()
+
+    return fresh, stale
+
+
+def store(rows: list) -> None:
+    """Upsert freshly checked rows (dicts with url/status/etag/last_modified)."""
+    now = datetime.datetime.utcnow()
+    records = {}
+    for row in rows:
+        status = row.get("status")
+        if status is None or not _ttl_for_status(status):
+            continue
+        records[row["url"]] = {
+            "url": row["url"],
+            "status": status,
+            "etag": row.get("etag"),
+            "last_modified": row.get("last_modified"),
+            "checked_at": now,
+        }
+    if not records:
+        return
+
+    stmt = insert(LinkCheckCache).values(list(records.values()))
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[LinkCheckCache.url],
+        set_={
+            "status": stmt.excluded.status,
+            "etag": stmt.excluded.etag,
+            "last_modified": stmt.excluded.last_modified,
+            "checked_at": stmt.excluded.checked_at,
+        },
+    )
+
+    db = SessionLocal()
+    try:
+        db.execute(stmt)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logging_manager.log_system_event(
+            "crawler", "warning", f"Link cache update failed: {e}"
+        )
+    finally:
+        db.close()
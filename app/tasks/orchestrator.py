@@ -1,15 +1,25 @@
-import advertools as adv
+import atexit
 from celery import chain
+from celery.signals import worker_process_shutdown
 from app.celery_app import celery_app
+from sqlalchemy import bindparam, select, text, update
 from app.db.session import SessionLocal
 from app.models.audit import Audit
+from app.models.dashboard_callback import DashboardCallback
+from app.services import link_cache
 import datetime
-import pandas as pd
+import email.utils
+import orjson
 import os
 import logging
+import random
 import re
-from collections import Counter, defaultdict
-from urllib.parse import urlparse
+import threading
+import weakref
+from collections import defaultdict
+from functools import lru_cache
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse, urlsplit, urlunsplit
 import httpx
 from app.core.config import settings
 from app.utils.error_handler import (
@@ -20,9 +30,14 @@ from app.utils.error_handler import (
 )
 from app.utils.logging_manager import TaskLogger, logging_manager
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
 import time
 
+# pandas and advertools (which pulls in Scrapy) are imported inside the tasks
+# that use them, so processes that only enqueue audits, like the API, don't
+# pay for loading them.
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def get_results_file_path(filename: str) -> str:
     """
@@ -66,186 +81,319 @@ def should_cleanup_file(file_path: str) -> bool:
 
 
 # --- Learning Notes: Stop Words ---
-STOP_WORDS = {
-    "i",
-    "me",
-    "my",
-    "myself",
-    "we",
-    "our",
-    "ours",
-    "ourselves",
-    "you",
-    "your",
-    "yours",
-    "yourself",
-    "yourselves",
-    "he",
-    "him",
-    "his",
-    "himself",
-    "she",
-    "her",
-    "hers",
-    "herself",
-    "it",
-    "its",
-    "itself",
-    "they",
-    "them",
-    "their",
-    "theirs",
-    "themselves",
-    "what",
-    "which",
-    "who",
-    "whom",
-    "this",
-    "that",
-    "these",
-    "those",
-    "am",
-    "is",
-    "are",
-    "was",
-    "were",
-    "be",
-    "been",
-    "being",
-    "have",
-    "has",
-    "had",
-    "having",
-    "do",
-    "does",
-    "did",
-    "doing",
-    "a",
-    "an",
-    "the",
-    "and",
-    "but",
-    "if",
-    "or",
-    "because",
-    "as",
-    "until",
-    "while",
-    "of",
-    "at",
-    "by",
-    "for",
-    "with",
-    "about",
-    "against",
-    "between",
-    "into",
-    "through",
-    "during",
-    "before",
-    "after",
-    "above",
-    "below",
-    "to",
-    "from",
-    "up",
-    "down",
-    "in",
-    "out",
-    "on",
-    "off",
-    "over",
-    "under",
-    "again",
-    "further",
-    "then",
-    "once",
-    "here",
-    "there",
-    "when",
-    "where",
-    "why",
-    "how",
-    "all",
-    "any",
-    "both",
-    "each",
-    "few",
-    "more",
-    "most",
-    "other",
-    "some",
-    "such",
-    "no",
-    "nor",
-    "not",
-    "only",
-    "own",
-    "same",
-    "so",
-    "than",
-    "too",
-    "very",
-    "s",
-    "t",
-    "can",
-    "will",
-    "just",
-    "don",
-    "should",
-    "now",
-    "d",
-    "ll",
-    "m",
-    "o",
-    "re",
-    "ve",
-    "y",
-    "-",
-    "–",
-    "|",
-    "page",
-    "archives",
-    "club",
-    "tag",
-    "category",
-    "author",
-    "events",
-    "jan",
-    "feb",
-    "mar",
-    "apr",
-    "may",
-    "jun",
-    "jul",
-    "aug",
-    "sep",
-    "oct",
-    "nov",
-    "dec",
-    "january",
-    "february",
-    "march",
-    "april",
-    "may",
-    "june",
-    "july",
-    "august",
-    "september",
-    "october",
-    "november",
-    "december",
-}
+STOP_WORDS = frozenset(
+    {
+        "i",
+        "me",
+        "my",
+        "myself",
+        "we",
+        "our",
+        "ours",
+        "ourselves",
+        "you",
+        "your",
+        "yours",
+        "yourself",
+        "yourselves",
+        "he",
+        "him",
+        "his",
+        "himself",
+        "she",
+        "her",
+        "hers",
+        "herself",
+        "it",
+        "its",
+        "itself",
+        "they",
+        "them",
+        "their",
+        "theirs",
+        "themselves",
+        "what",
+        "which",
+        "who",
+        "whom",
+        "this",
+        "that",
+        "these",
+        "those",
+        "am",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "having",
+        "do",
+        "does",
+        "did",
+        "doing",
+        "a",
+        "an",
+        "the",
+        "and",
+        "but",
+        "if",
+        "or",
+        "because",
+        "as",
+        "until",
+        "while",
+        "of",
+        "at",
+        "by",
+        "for",
+        "with",
+        "about",
+        "against",
+        "between",
+        "into",
+        "through",
+        "during",
+        "before",
+        "after",
+        "above",
+        "below",
+        "to",
+        "from",
+        "up",
+        "down",
+        "in",
+        "out",
+        "on",
+        "off",
+        "over",
+        "under",
+        "again",
+        "further",
+        "then",
+        "once",
+        "here",
+        "there",
+        "when",
+        "where",
+        "why",
+        "how",
+        "all",
+        "any",
+        "both",
+        "each",
+        "few",
+        "more",
+        "most",
+        "other",
+        "some",
+        "such",
+        "no",
+        "nor",
+        "not",
+        "only",
+        "own",
+        "same",
+        "so",
+        "than",
+        "too",
+        "very",
+        "s",
+        "t",
+        "can",
+        "will",
+        "just",
+        "don",
+        "should",
+        "now",
+        "d",
+        "ll",
+        "m",
+        "o",
+        "re",
+        "ve",
+        "y",
+        "-",
+        "–",
+        "|",
+        "page",
+        "archives",
+        "club",
+        "tag",
+        "category",
+        "author",
+        "events",
+        "jan",
+        "feb",
+        "mar",
+        "apr",
+        "may",
+        "jun",
+        "jul",
+        "aug",
+        "sep",
+        "oct",
+        "nov",
+        "dec",
+        "january",
+        "february",
+        "march",
+        "april",
+        "may",
+        "june",
+        "july",
+        "august",
+        "september",
+        "october",
+        "november",
+        "december",
+    }
+)
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Long-lived client for dashboard callbacks. With Celery's prefork pool every
+# worker process gets its own client, so the connection to the dashboard (and
+# its TLS session) is reused across callbacks instead of set up per task.
+_dashboard_client = httpx.Client(
+    http2=True,
+    timeout=30.0,
+    # Callbacks are sporadic, so keep idle connections longer than httpx's 5s
+    # default or nearly every callback would pay for a new handshake.
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60.0),
+)
+atexit.register(_dashboard_client.close)
+
+# Statuses an audit never leaves: COMPLETE from save_final_report, FAILED and
+# PARTIAL from _mark_audit_failed, ERROR when the final save itself fails.
+# Redelivered tasks must not overwrite them or queue another callback.
+FINAL_AUDIT_STATUSES = ("COMPLETE", "FAILED", "PARTIAL", "ERROR")
+
+# Initial attempt plus 5 retries, matching the old Celery retry policy.
+DASHBOARD_CALLBACK_MAX_ATTEMPTS = 6
+# How long a sweep holds on to the callbacks it claimed.
+DASHBOARD_CALLBACK_LEASE_SECONDS = 600
+# Longest wait between two attempts, before jitter.
+DASHBOARD_CALLBACK_BACKOFF_MAX_SECONDS = 1800
+# 4xx responses that mean "try again later" rather than "bad request"; these
+# and 5xx are retried, any other error status fails the callback at once.
+DASHBOARD_RETRYABLE_STATUSES = frozenset({408, 425, 429})
+
+
+def _dashboard_retry_delay(attempts: int) -> float:
+    """
+    Seconds until the next callback attempt: exponential backoff (60s, 120s,
+    240s, ...) up to DASHBOARD_CALLBACK_BACKOFF_MAX_SECONDS, stretched by up to
+    50% at random so callbacks that failed together (e.g. during a dashboard
+    outage) don't all come due in the same sweep.
+    """
+    delay = min(60 * (2 ** (attempts - 1)), DASHBOARD_CALLBACK_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(1.0, 1.5)
+
+
+def _retry_after_seconds(response: httpx.Response, now: datetime.datetime):
+    """
+    Seconds the dashboard asked us to wait via `Retry-After` (either
+    delta-seconds or an HTTP date), or None if the header is missing or invalid.
+    """
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is not None:
+        retry_at = retry_at.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return max(0, round((retry_at - now).total_seconds()))
+
+
+# Top words are whole ASCII words only, so fragments of tokens like "mp3" or
+# "café" are left out: text is split on runs of non-word characters and only
+# the all-lowercase-ASCII pieces are kept.
+_NON_WORD_PATTERN = r"[^\pL\pN_]+"
+_ASCII_WORD_PATTERN = r"^[a-z]+$"
+
+
+def _get_top_words_multi(columns: list, n: int = 10) -> list:
+    """
+    Top `n` (word, count) pairs for each Series in `columns`; a column that
+    is None gets an empty list.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    stop_words = pa.array(sorted(STOP_WORDS))
+    results = []
+    for series in columns:
+        if series is None:
+            results.append([])
+            continue
+        # Tokenize, filter and count with Arrow's string kernels instead of a
+        # Python regex per cell
+        texts = pa.array(series.dropna().astype(str).tolist(), type=pa.string())
+        tokens = pc.list_flatten(
+            pc.split_pattern_regex(pc.utf8_lower(texts), _NON_WORD_PATTERN)
+        )
+        keep = pc.and_(
+            pc.match_substring_regex(tokens, _ASCII_WORD_PATTERN),
+            pc.invert(pc.is_in(tokens, value_set=stop_words)),
+        )
+        counts = pc.value_counts(tokens.filter(keep))
+        # value_counts keeps first-seen order and the sort is stable, so ties
+        # come out in the same order as Counter.most_common
+        order = pc.array_sort_indices(counts.field("counts"), order="descending")
+        top = counts.take(order[:n])
+        results.append(
+            list(zip(top.field("values").to_pylist(), top.field("counts").to_pylist()))
+        )
+    return results
+
+
+# Host part of an absolute http(s) link (bracketed for IPv6 literals)
+_LINK_HOST_PATTERN = r"^https?://(?:[^/?#@]*@)?(\[[^\]/]*\]|[^/?#:]+)"
+
 
-def _get_top_words(series: pd.Series, n: int = 10) -> list:
-    text = series.dropna().str.cat(sep=" ").lower()
-    words = re.findall(r"\b[a-z]+\b", text)
-    word_counts = Counter(w for w in words if w not in STOP_WORDS)
-    return word_counts.most_common(n)
+# Crawl output columns used by the report. Everything else advertools writes
+# is skipped.
+CRAWL_REPORT_COLUMNS = (
+    "url",
+    "title",
+    "meta_desc",
+    "h1",
+    "status",
+    "request_headers_Referer",
+    "links_url",
+)
+
+
+def _read_crawl_output(crawl_output_file: str) -> "pd.DataFrame":
+    """Stream the crawl's JSON lines into a DataFrame of CRAWL_REPORT_COLUMNS."""
+    import pandas as pd
+
+    columns = {name: [] for name in CRAWL_REPORT_COLUMNS}
+    seen = set()
+    with open(crawl_output_file, "rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            seen.update(name for name in CRAWL_REPORT_COLUMNS if name in record)
+            for name, values in columns.items():
+                values.append(record.get(name))
+
+    # Only keep columns the crawl actually produced, as read_json would
+    return pd.DataFrame(
+        {name: values for name, values in columns.items() if name in seen}
+    )
 
 
 def _mark_audit_failed(audit_id: int, error_message: str, url: str = None):
@@ -254,42 +402,55 @@ def _mark_audit_failed(audit_id: int, error_message: str, url: str = None):
 
     db = SessionLocal()
     try:
-        audit = db.query(Audit).filter(Audit.id == audit_id).first()
-        if audit:
-            # Only update if not already in a final state to prevent duplicates
-            if audit.status not in ["FAILED", "COMPLETE"]:
-                audit.status = error_info["status"]
-                audit.error_message = error_info["user_message"]
-                audit.technical_error = error_info["technical_message"]
-                audit.report_json = {}
-                audit.completed_at = datetime.datetime.utcnow()
-                db.commit()
+        # One conditional UPDATE instead of load-check-commit; the status guard
+        # in the WHERE clause also keeps two failing tasks from both winning
+        result = db.execute(
+            update(Audit)
+            .where(Audit.id == audit_id, Audit.status.not_in(FINAL_AUDIT_STATUSES))
+            .values(
+                status=error_info["status"],
+                error_message=error_info["user_message"],
+                technical_error=error_info["technical_message"],
+                report_json={},
+                page_level_report=None,
+                completed_at=datetime.datetime.utcnow(),
+            )
+        )
+        if result.rowcount:
+            # Send webhook for failed audits too (only once). The callback is
+            # stored in the same transaction as the status, so it can't be lost
+            # between the two.
+            callback_id = None
+            if settings.DASHBOARD_CALLBACK_URL:
+                callback_id = _queue_dashboard_callback(
+                    db, audit_id, _build_callback_payload(db.get(Audit, audit_id))
+                )
+            db.commit()
+            logging_manager.log_system_event(
+                "app",
+                "info",
+                f"Marked audit {audit_id} as {error_info['status']}: {error_info['user_message']}",
+            )
+
+            if callback_id is not None:
                 logging_manager.log_system_event(
                     "app",
                     "info",
-                    f"Marked audit {audit_id} as {error_info['status']}: {error_info['user_message']}",
+                    f"Dashboard callback URL is set, queueing callback task for failed audit_id: {audit_id}",
                 )
-
-                # Send webhook for failed audits too (only once)
-                if settings.DASHBOARD_CALLBACK_URL:
-                    logging_manager.log_system_event(
-                        "app",
-                        "info",
-                        f"Dashboard callback URL is set, queueing callback task for failed audit_id: {audit_id}",
-                    )
-                    send_report_to_dashboard.delay(audit_id=audit_id)
-                else:
-                    logging_manager.log_system_event(
-                        "app",
-                        "info",
-                        f"No dashboard callback URL configured. Skipping callback for failed audit_id: {audit_id}",
-                    )
+                _send_queued_callback(audit_id, callback_id)
             else:
                 logging_manager.log_system_event(
                     "app",
                     "info",
-                    f"Audit {audit_id} already in final state {audit.status}, skipping duplicate update",
+                    f"No dashboard callback URL configured. Skipping callback for failed audit_id: {audit_id}",
                 )
+        else:
+            logging_manager.log_system_event(
+                "app",
+                "info",
+                f"Audit {audit_id} missing or already in a final state, skipping duplicate update",
+            )
 
     except Exception as db_error:
         logging_manager.log_system_event(
@@ -299,8 +460,87 @@ def _mark_audit_failed(audit_id: int, error_message: str, url: str = None):
         db.close()
 
 
+def _build_callback_payload(audit) -> dict:
+    """
+    Build the dashboard callback payload from an audit row.
+
+    Accepts either an `Audit` instance or a row returned by an UPDATE ... RETURNING
+    that selects the same columns, with the assembled report as `full_report_json`.
+    """
+    # Order matches the API response exactly for consistency
+    return {
+        "audit_id": audit.id,
+        "status": audit.status,
+        "url": audit.url,
+        "user_id": audit.user_id,
+        "user_audit_report_request_id": audit.user_audit_report_request_id,
+        "created_at": audit.created_at.isoformat(),
+        "completed_at": (
+            audit.completed_at.isoformat() if audit.completed_at else None
+        ),
+        "error_message": audit.error_message,
+        "technical_error": audit.technical_error,
+        "report_json": audit.full_report_json,
+    }
+
+
+def _load_callback_payload(audit_id: int):
+    """Load an audit and build its callback payload, or None if it doesn't exist."""
+    db = SessionLocal()
+    try:
+        audit = db.get(Audit, audit_id)
+        return _build_callback_payload(audit) if audit else None
+    finally:
+        db.close()
+
+
+def _queue_dashboard_callback(db, audit_id: int, callback_payload: dict) -> int:
+    """
+    Add a pending dashboard callback to the caller's transaction and return its
+    id. The row is due at once: `send_report_to_dashboard` delivers it right
+    after the commit, and the retry sweep does if that task never runs.
+    """
+    callback = DashboardCallback(
+        audit_id=audit_id,
+        payload=orjson.dumps(callback_payload),
+        status="PENDING",
+        attempts=0,
+        next_attempt_at=datetime.datetime.utcnow(),
+    )
+    db.add(callback)
+    db.flush()
+    return callback.id
+
+
+def _send_queued_callback(audit_id: int, callback_id: int) -> None:
+    """Ask a worker to deliver a committed callback now rather than on the next sweep."""
+    try:
+        send_report_to_dashboard.delay(audit_id=audit_id, callback_id=callback_id)
+    except Exception as e:
+        # The row is already committed, so the sweep still delivers it
+        logging_manager.log_audit_event(
+            audit_id,
+            "warning",
+            "Could not queue dashboard callback task, leaving it to the retry sweep",
+            {"callback_id": callback_id, "error": str(e)},
+        )
+
+
+# The crawl can outlast the broker's ack timeout, so it is acknowledged on
+# receipt. The later steps are safe to run again (save_final_report only
+# finalizes an audit once) and are acknowledged when they finish, so a worker
+# that is stopped or loses its broker connection mid-step leaves the message
+# to be redelivered rather than dropped.
+#
+# Each step hands its return value to the next one inside the chain message, so
+# nothing reads the later steps' results from the backend. Those steps set
+# ignore_result to skip writing their (large) report dicts there; failures are
+# recorded on the audit row. The crawl and run_full_audit keep their results
+# because their task ids are the ones view_result.py and API clients see.
 @celery_app.task(bind=True)
 def run_advertools_crawl(self, audit_id: int, url: str, max_pages: int) -> str:
+    import advertools as adv
+
     task_context = {"url": url, "max_pages": max_pages, "task_id": self.request.id}
 
     with TaskLogger(
@@ -404,8 +644,10 @@ def run_advertools_crawl(self, audit_id: int, url: str, max_pages: int) -> str:
             raise
 
 
-@celery_app.task(bind=True)
+@celery_app.task(bind=True, acks_late=True, ignore_result=True)
 def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> dict:
+    import pandas as pd
+
     task_context = {"crawl_output_file": crawl_output_file, "task_id": self.request.id}
 
     with TaskLogger(
@@ -422,19 +664,10 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
         )
 
         try:
-            # Validate crawl output first
-            task_logger.log("info", "Validating crawl output file")
-            output_valid, output_error = validate_crawl_output(crawl_output_file)
-            if not output_valid:
-                error_msg = f"Invalid crawl output: {output_error}"
-                task_logger.log(
-                    "error", "Crawl output validation failed", {"error": error_msg}
-                )
-                _mark_audit_failed(audit_id, error_msg)
-                raise ValueError(error_msg)
-
+            # The crawl task validated this file before handing it over, so it
+            # is read once here; a missing or corrupted file still fails below
             task_logger.log("info", "Reading crawl data from JSON file")
-            crawl_df = pd.read_json(crawl_output_file, lines=True)
+            crawl_df = _read_crawl_output(crawl_output_file)
 
             # Additional validation for required columns
             if crawl_df.empty:
@@ -466,128 +699,113 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
 
         try:
             task_logger.log("info", "Starting page-level analysis")
-            page_level_report = {}
-            (
-                pages_with_title,
-                pages_with_meta_desc,
-                pages_with_one_h1,
-                pages_with_multiple_h1s,
-                pages_with_no_h1,
-            ) = (0, 0, 0, 0, 0)
-
-            for _, row in crawl_df.iterrows():
-                url = row.get("url")
-                if not url:
-                    continue
-                page_report = []
-
-                # Handle title safely
-                title = row.get("title")
-                if pd.notna(title) and title:
-                    pages_with_title += 1
-                    page_report.append(
+
+            def text_column(name: str) -> "pd.Series":
+                """Stripped values of a text column, None where missing or empty."""
+                values = pd.Series(None, index=crawl_df.index, dtype=object)
+                if name in crawl_df.columns:
+                    column = crawl_df[name]
+                    present = column.notna() & column.astype(bool)
+                    values[present] = column[present].astype(str).str.strip()
+                return values
+
+            # Rows without a URL can't be reported on
+            if "url" in crawl_df.columns:
+                urls = crawl_df["url"]
+            else:
+                urls = pd.Series(None, index=crawl_df.index, dtype=object)
+            has_url = urls.notna() & urls.astype(bool)
+            urls = urls[has_url]
+
+            titles = text_column("title")[has_url]
+            meta_descs = text_column("meta_desc")[has_url]
+            has_title = titles.notna()
+            has_meta_desc = meta_descs.notna()
+
+            # advertools joins multiple H1s on a page with "@@"
+            if "h1" in crawl_df.columns:
+                h1_lists = (
+                    crawl_df.loc[has_url, "h1"]
+                    .fillna("")
+                    .astype(str)
+                    .str.split("@@")
+                    .map(lambda parts: [p.strip() for p in parts if p.strip()])
+                )
+            else:
+                h1_lists = pd.Series(
+                    [[] for _ in range(len(urls))], index=urls.index, dtype=object
+                )
+            h1_counts = h1_lists.map(len)
+
+            pages_with_title = int(has_title.sum())
+            pages_with_meta_desc = int(has_meta_desc.sum())
+            pages_with_one_h1 = int((h1_counts == 1).sum())
+            pages_with_multiple_h1s = int((h1_counts > 1).sum())
+            pages_with_no_h1 = int((h1_counts == 0).sum())
+
+            def h1_check(h1_tags: list) -> dict:
+                if not h1_tags:
+                    return {
+                        "status": "FAILURE",
+                        "check": "h1_heading",
+                        "message": "No H1 tag found.",
+                        "count": 0,
+                        "value": [],
+                    }
+                if len(h1_tags) == 1:
+                    return {
+                        "status": "SUCCESS",
+                        "check": "h1_heading",
+                        "message": "Exactly one H1 tag found.",
+                        "count": 1,
+                        "value": h1_tags[0],
+                    }
+                return {
+                    "status": "FAILURE",
+                    "check": "h1_heading",
+                    "message": f"Found {len(h1_tags)} H1 tags. Expected 1.",
+                    "count": len(h1_tags),
+                    "value": h1_tags,
+                }
+
+            page_level_report = {
+                url: [
+                    (
                         {
                             "status": "SUCCESS",
                             "check": "title",
-                            "value": title.strip(),
+                            "value": title,
                             "message": "Title found.",
                         }
-                    )
-                else:
-                    page_report.append(
-                        {
+                        if title is not None
+                        else {
                             "status": "FAILURE",
                             "check": "title",
                             "value": None,
                             "message": "Title tag not found or is empty.",
                         }
-                    )
-
-                # Handle meta description safely
-                meta_desc = row.get("meta_desc")
-                if pd.notna(meta_desc) and meta_desc:
-                    pages_with_meta_desc += 1
-                    page_report.append(
+                    ),
+                    (
                         {
                             "status": "SUCCESS",
                             "check": "meta_description",
-                            "value": meta_desc.strip(),
+                            "value": meta_desc,
                             "message": "Meta description found.",
                         }
-                    )
-                else:
-                    page_report.append(
-                        {
+                        if meta_desc is not None
+                        else {
                             "status": "FAILURE",
                             "check": "meta_description",
                             "value": None,
                             "message": "Meta description not found or is empty.",
                         }
-                    )
-
-                # Handle H1 tags
-                h1_tags = row.get("h1", [])
-                if pd.isna(h1_tags) or (
-                    isinstance(h1_tags, list) and len(h1_tags) == 0
-                ):
-                    pages_with_no_h1 += 1
-                    page_report.append(
-                        {
-                            "status": "FAILURE",
-                            "check": "h1_heading",
-                            "message": "No H1 tag found.",
-                            "count": 0,
-                            "value": [],
-                        }
-                    )
-                elif isinstance(h1_tags, list) and len(h1_tags) == 1:
-                    pages_with_one_h1 += 1
-                    page_report.append(
-                        {
-                            "status": "SUCCESS",
-                            "check": "h1_heading",
-                            "message": "Exactly one H1 tag found.",
-                            "count": 1,
-                            "value": h1_tags[0],
-                        }
-                    )
-                elif isinstance(h1_tags, list) and len(h1_tags) > 1:
-                    pages_with_multiple_h1s += 1
-                    page_report.append(
-                        {
-                            "status": "FAILURE",
-                            "check": "h1_heading",
-                            "message": f"Found {len(h1_tags)} H1 tags. Expected 1.",
-                            "count": len(h1_tags),
-                            "value": h1_tags,
-                        }
-                    )
-                else:
-                    # Handle non-list H1 tags
-                    if h1_tags:
-                        pages_with_one_h1 += 1
-                        page_report.append(
-                            {
-                                "status": "SUCCESS",
-                                "check": "h1_heading",
-                                "message": "Exactly one H1 tag found.",
-                                "count": 1,
-                                "value": str(h1_tags),
-                            }
-                        )
-                    else:
-                        pages_with_no_h1 += 1
-                        page_report.append(
-                            {
-                                "status": "FAILURE",
-                                "check": "h1_heading",
-                                "message": "No H1 tag found.",
-                                "count": 0,
-                                "value": [],
-                            }
-                        )
-
-                page_level_report[url] = page_report
+                    ),
+                    h1_check(h1_tags),
+                ]
+                for url, title, meta_desc, h1_tags in zip(
+                    urls, titles, meta_descs, h1_lists
+                )
+            }
 
             task_logger.log(
                 "info",
@@ -619,41 +837,48 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
 
         try:
             if "status" in crawl_df.columns:
-                error_links_df = crawl_df[crawl_df["status"] >= 400].copy()
+                # Only the columns used below, so the error rows don't drag
+                # along every other crawl column
+                referer_col = "request_headers_Referer"
+                error_columns = [
+                    c for c in ("url", "status", referer_col) if c in crawl_df.columns
+                ]
+                error_links_df = crawl_df.loc[crawl_df["status"] >= 400, error_columns]
                 
+                # Plain lists of the columns, rather than a Series per row
+                urls = (
+                    error_links_df["url"].tolist()
+                    if "url" in error_links_df.columns
+                    else ["Unknown URL"] * len(error_links_df)
+                )
+                statuses = error_links_df["status"].tolist()
+
                 # Build internal URL to source mapping (same as external links)
                 internal_url_to_source_mapping = {}
-                
-                referer_col = "request_headers_Referer"
+
                 if referer_col in error_links_df.columns:
-                    error_links_df.rename(
-                        columns={referer_col: "source_url"}, inplace=True
-                    )
-                    error_links_df["source_url"] = error_links_df["source_url"].where(
-                        pd.notna(error_links_df["source_url"]), "Internal Navigation"
-                    )
-                    
-                    # Build mapping of URLs to their source URLs (handle multiple sources)
-                    for _, row in error_links_df.iterrows():
-                        url = row.get("url", "Unknown URL")
-                        source = row.get("source_url", "Internal Navigation")
-                        
-                        if url not in internal_url_to_source_mapping:
-                            internal_url_to_source_mapping[url] = []
-                        if source not in internal_url_to_source_mapping[url]:
-                            internal_url_to_source_mapping[url].append(source)
-                else:
-                    error_links_df["source_url"] = "Internal Navigation"
+                    referers = error_links_df[referer_col]
+                    referer_urls = referers.where(
+                        referers.notna(), "Internal Navigation"
+                    ).tolist()
+
+                    # Build mapping of URLs to their source URLs (handle multiple
+                    # sources); dict keys deduplicate them while preserving order
+                    url_sources = defaultdict(dict)
+                    for url, source in zip(urls, referer_urls):
+                        url_sources[url][source] = None
+                    internal_url_to_source_mapping = {
+                        url: list(sources) for url, sources in url_sources.items()
+                    }
 
                 internal_false_positives_filtered = 0
 
                 # Categorize internal links by status code (same logic as external links)
-                for _, row in error_links_df.iterrows():
-                    url = row.get("url", "Unknown URL")
-                    status = row.get("status", -1)
-
+                for url, status in zip(urls, statuses):
                     # Apply false positive filtering to internal links too
-                    is_false_pos, reason = is_likely_false_positive(url, status)
+                    is_false_pos, reason = is_likely_false_positive(
+                        url.lower(), status
+                    )
                     if is_false_pos:
                         internal_false_positives_filtered += 1
                         task_logger.log(
@@ -694,23 +919,28 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
                     "warning",
                     "No 'status' column found in crawl data. Checking for error records.",
                 )
-                # Look for timeout/error indicators in the data
-                for _, row in crawl_df.iterrows():
-                    url = row.get("url", "Unknown URL")
-                    # Check for common error indicators
-                    if (
-                        pd.isna(row.get("title"))
-                        and pd.isna(row.get("meta_desc"))
-                        and pd.isna(row.get("h1"))
-                    ):
-                        # This suggests a failed request (timeout, connection error, etc.)
-                        internal_unreachable_links.append(
-                            {
-                                "url": url,
-                                "status": "Unreachable",
-                                "source_urls": ["Timeout/Error"],
-                            }
-                        )
+                # Look for timeout/error indicators in the data: a page with no
+                # title, meta description or H1 suggests a failed request
+                # (timeout, connection error, etc.)
+                content_columns = [
+                    c for c in ("title", "meta_desc", "h1") if c in crawl_df.columns
+                ]
+                if content_columns:
+                    failed = crawl_df[content_columns].isna().all(axis=1)
+                else:
+                    failed = pd.Series(True, index=crawl_df.index)
+                if "url" in crawl_df.columns:
+                    failed_urls = crawl_df.loc[failed, "url"].tolist()
+                else:
+                    failed_urls = ["Unknown URL"] * int(failed.sum())
+                internal_unreachable_links.extend(
+                    {
+                        "url": url,
+                        "status": "Unreachable",
+                        "source_urls": ["Timeout/Error"],
+                    }
+                    for url in failed_urls
+                )
                 if internal_unreachable_links:
                     task_logger.log(
                         "info",
@@ -725,32 +955,51 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
             # Fix: Get main domain from audit URL instead of first crawled URL
             db = SessionLocal()
             try:
-                audit = db.query(Audit).filter(Audit.id == audit_id).first()
-                if not audit:
+                # Only the URL is needed, not the row and its report columns
+                audit_url = db.scalar(select(Audit.url).where(Audit.id == audit_id))
+                if audit_url is None:
                     raise ValueError(f"Audit {audit_id} not found")
-                main_domain = urlparse(audit.url).netloc
-                task_logger.log("info", f"Using main domain: {main_domain} (from audit URL: {audit.url})")
+                main_domain = urlparse(audit_url).netloc
+                task_logger.log("info", f"Using main domain: {main_domain} (from audit URL: {audit_url})")
             finally:
                 db.close()
             
-            link_df = adv.crawlytics.links(crawl_df, internal_url_regex=main_domain)
-
-            # Check if 'internal' column exists
-            if "internal" in link_df.columns:
-                external_links_df = link_df[~link_df["internal"]].copy()
-                external_links_df.dropna(subset=["link"], inplace=True)
-                external_links_df["link"] = external_links_df["link"].astype(str)
+            if "links_url" in crawl_df.columns:
+                # advertools joins each page's links with "@@"; one row per link.
+                link_df = (
+                    crawl_df[["url", "links_url"]]
+                    .dropna(subset=["links_url"])
+                    .assign(link=lambda d: d["links_url"].astype(str).str.split("@@"))
+                    .explode("link")
+                    .dropna(subset=["link"])
+                )
+                # A link is internal when its host is the site's host or one of
+                # its subdomains ("www." aside). Comparing hosts, rather than
+                # searching the whole link for the domain, keeps links like
+                # ".../share?url=example.com" external. Links without an
+                # http(s) host (mailto:, tel:, ...) aren't checked.
+                site_host = (urlparse(audit_url).hostname or "").removeprefix("www.")
+                link_hosts = (
+                    link_df["link"]
+                    .str.extract(_LINK_HOST_PATTERN, flags=re.IGNORECASE, expand=False)
+                    .str.lower()
+                    .str.removeprefix("www.")
+                )
+                is_internal = link_hosts.eq(site_host) | link_hosts.str.endswith(
+                    "." + site_host, na=False
+                )
+                external_links_df = link_df[link_hosts.notna() & ~is_internal]
                 links_to_check = external_links_df.rename(
                     columns={"url": "source_url"}
                 )[["link", "source_url"]].to_dict("records")
                 task_logger.log(
                     "info",
-                    f"Found {len(external_links_df['link'].unique())} unique external links to check",
+                    f"Found {external_links_df['link'].nunique()} unique external links to check",
                 )
             else:
                 task_logger.log(
                     "warning",
-                    "No 'internal' column found in links data. Skipping external link analysis.",
+                    "No 'links_url' column found in crawl data. Skipping external link analysis.",
                 )
         except Exception as e:
             task_logger.log(
@@ -760,6 +1009,9 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
             )
 
         total_pages = len(page_level_report)
+        top_title_words, top_h1_words = _get_top_words_multi(
+            [crawl_df.get("title"), crawl_df.get("h1")]
+        )
         initial_report = {
             "status": "ANALYZING_EXTERNAL",
             "audit_id": audit_id,
@@ -777,26 +1029,19 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
                 "pages_with_correct_h1": pages_with_one_h1,
                 "pages_with_multiple_h1s": pages_with_multiple_h1s,
                 "pages_with_no_h1": pages_with_no_h1,
-                "top_10_title_words": (
-                    _get_top_words(crawl_df["title"])
-                    if "title" in crawl_df.columns
-                    else []
-                ),
-                "top_10_h1_words": (
-                    _get_top_words(crawl_df["h1"]) if "h1" in crawl_df.columns else []
-                ),
+                "top_10_title_words": top_title_words,
+                "top_10_h1_words": top_h1_words,
             },
             "internal_unreachable_links": internal_unreachable_links,
             "internal_broken_links": internal_broken_links,
             "internal_permission_issue_links": internal_permission_issue_links,
             "internal_method_issue_links": internal_method_issue_links,
             "internal_other_client_errors": internal_other_client_errors,
-            "page_level_report": page_level_report,
         }
 
         task_logger.log(
             "info",
-            "Saving initial report to database",
+            "Saving page-level report to database",
             {
                 "total_pages": total_pages,
                 "external_links_to_check": len(links_to_check),
@@ -806,17 +1051,36 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
         try:
             db = SessionLocal()
             try:
-                audit = db.query(Audit).filter(Audit.id == audit_id).first()
-                if audit:
-                    audit.status = "ANALYZING_EXTERNAL"
-                    audit.report_json = initial_report
+                # Write-only, so skip loading the row into the session. The
+                # compiled report is stored now so in-progress audits show it
+                # and it survives a lost chain message; it also travels down
+                # the chain so save_final_report can merge the external link
+                # results without reading it back. The top-level status and
+                # audit_id keys are separate columns in the 'audits' table.
+                result = db.execute(
+                    update(Audit)
+                    .where(Audit.id == audit_id)
+                    .values(
+                        status="ANALYZING_EXTERNAL",
+                        report_json={
+                            key: value
+                            for key, value in initial_report.items()
+                            if key not in ("status", "audit_id")
+                        },
+                        # Stored in its own column so later report updates don't
+                        # rewrite the (potentially very large) per-page data.
+                        page_level_report=page_level_report,
+                    )
+                )
+                if result.rowcount:
                     db.commit()
-                    task_logger.log("info", "Initial report saved successfully")
+                    task_logger.log("info", "Page-level report saved successfully")
             finally:
                 db.close()
             return {
                 "crawl_output_file": crawl_output_file,
                 "links_to_check": links_to_check,
+                "report": initial_report,
             }
         except Exception as e:
             error_msg = f"Failed to save report compilation: {str(e)}"
@@ -829,11 +1093,11 @@ def compile_report_from_crawl(self, crawl_output_file: str, audit_id: int) -> di
             raise
 
 
-@celery_app.task(bind=True)
+@celery_app.task(bind=True, acks_late=True, ignore_result=True)
 def check_external_links(self, previous_task_output: dict, audit_id: int) -> dict:
     """
-    Check external links using async chunked processing.
-    This version prevents blocking and handles domain collisions intelligently.
+    Check external links using async per-URL processing.
+    This version prevents blocking and keeps per-host concurrency polite.
     """
     task_context = {
         "task_id": self.request.id,
@@ -852,26 +1116,24 @@ def check_external_links(self, previous_task_output: dict, audit_id: int) -> dic
 
         if not links_to_check:
             task_logger.log("info", "No external links to check. Skipping.")
-            return {"crawl_output_file": crawl_output_file, "external_links_report": {}}
+            return {
+                "crawl_output_file": crawl_output_file,
+                "report": previous_task_output.get("report"),
+                "external_links_report": {},
+            }
 
         task_logger.log("info", f"Processing {len(links_to_check)} external links")
 
-        # Create URL to source mapping for preserving ALL source URLs
-        links_df = pd.DataFrame(links_to_check)
-        url_to_source_mapping = {}
-
-        for _, row in links_df.iterrows():
-            url = row["link"]
-            source = row["source_url"]
-            if url not in url_to_source_mapping:
-                url_to_source_mapping[url] = []
-            url_to_source_mapping[url].append(source)
-
-        # Remove duplicates while preserving order
-        for url in url_to_source_mapping:
-            url_to_source_mapping[url] = list(dict.fromkeys(url_to_source_mapping[url]))
+        # Create URL to source mapping for preserving ALL source URLs; dict
+        # keys deduplicate the sources while preserving order
+        url_sources = defaultdict(dict)
+        for link in links_to_check:
+            url_sources[link["link"]][link["source_url"]] = None
+        url_to_source_mapping = {
+            url: list(sources) for url, sources in url_sources.items()
+        }
 
-        unique_urls_to_check = list(url_to_source_mapping.keys())
+        unique_urls_to_check = list(url_to_source_mapping)
 
         task_logger.log(
             "info",
@@ -884,19 +1146,12 @@ def check_external_links(self, previous_task_output: dict, audit_id: int) -> dic
         )
 
         try:
-            # Run the async function in the current thread
-            # Since this is a Celery task, we need to create a new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            try:
-                external_links_report = loop.run_until_complete(
-                    check_external_links_async(
-                        unique_urls_to_check, audit_id, url_to_source_mapping
-                    )
+            # Run the async function on this thread's long-lived event loop
+            external_links_report = _link_check_runner().run(
+                check_external_links_async(
+                    unique_urls_to_check, audit_id, url_to_source_mapping
                 )
-            finally:
-                loop.close()
+            )
 
             task_logger.log(
                 "info",
@@ -924,16 +1179,18 @@ def check_external_links(self, previous_task_output: dict, audit_id: int) -> dic
                 "permission_issues": [],
                 "method_issues": [],
                 "other_client_errors": [],
+                "unchecked_links": [],
                 "error": str(e),
             }
 
         return {
             "crawl_output_file": crawl_output_file,
+            "report": previous_task_output.get("report"),
             "external_links_report": external_links_report,
         }
 
 
-@celery_app.task(bind=True)
+@celery_app.task(bind=True, acks_late=True, ignore_result=True)
 def save_final_report(self, previous_task_output: dict, audit_id: int):
     task_context = {
         "task_id": self.request.id,
@@ -954,6 +1211,7 @@ def save_final_report(self, previous_task_output: dict, audit_id: int):
         permission_issues = external_links_report.get("permission_issues", [])
         method_issues = external_links_report.get("method_issues", [])
         other_client_errors = external_links_report.get("other_client_errors", [])
+        unchecked_links = external_links_report.get("unchecked_links", [])
 
         task_logger.log(
             "info",
@@ -965,75 +1223,127 @@ def save_final_report(self, previous_task_output: dict, audit_id: int):
             },
         )
 
+        callback_id = None
         db = SessionLocal()
         try:
-            audit = db.query(Audit).filter(Audit.id == audit_id).first()
-            if not audit:
-                task_logger.log("error", "Audit not found for final save")
-                return
-
-            task_logger.log("info", "Building final report structure")
-            report_json = audit.report_json.copy()
-            summary = report_json["summary"]
-            summary.update(
-                {
-                    "external_unreachable_links_found": len(unreachable_links),
-                    "external_broken_links_found": len(broken_links),
-                    "external_permission_issues_found": len(permission_issues),
-                    "external_method_issues_found": len(method_issues),
-                    "external_other_client_errors_found": len(other_client_errors),
-                }
-            )
-
-            # This is the final JSON object that will be stored in the database.
-            # It should NOT contain redundant top-level keys like status or audit_id,
-            # as those are separate columns in the 'audits' table.
-            final_report_blob = {
-                "summary": summary,
+            task_logger.log("info", "Writing final report")
+
+            # compile_report_from_crawl passes its report down the chain as
+            # well as storing it, so the final report_json is built here with
+            # the external summary counters and link arrays merged in. The
+            # top-level status and audit_id keys are dropped, as those are
+            # separate columns in the 'audits' table.
+            external_summary = {
+                "external_unreachable_links_found": len(unreachable_links),
+                "external_broken_links_found": len(broken_links),
+                "external_permission_issues_found": len(permission_issues),
+                "external_method_issues_found": len(method_issues),
+                "external_other_client_errors_found": len(other_client_errors),
+                # Non-zero when the link check hit its deadline
+                "external_unchecked_links_found": len(unchecked_links),
+            }
+            external_links = {
                 "external_unreachable_links": unreachable_links,
                 "external_broken_links": broken_links,
                 "external_permission_issue_links": permission_issues,
                 "external_method_issue_links": method_issues,
                 "external_other_client_errors": other_client_errors,
-                "internal_unreachable_links": report_json["internal_unreachable_links"],
-                "internal_broken_links": report_json["internal_broken_links"],
-                "internal_permission_issue_links": report_json[
-                    "internal_permission_issue_links"
-                ],
-                "internal_method_issue_links": report_json[
-                    "internal_method_issue_links"
-                ],
-                "internal_other_client_errors": report_json[
-                    "internal_other_client_errors"
-                ],
-                "page_level_report": report_json["page_level_report"],
+                "external_unchecked_links": unchecked_links,
             }
+            report = previous_task_output.get("report")
+            if report is not None:
+                report = {
+                    key: value
+                    for key, value in report.items()
+                    if key not in ("status", "audit_id")
+                }
+                report["summary"] = {**report.get("summary", {}), **external_summary}
+                report.update(external_links)
+
+            # Chains queued before the report was passed along stored it in
+            # report_json already; for those (report is NULL) it is patched in
+            # place instead. Only an audit that isn't final yet is updated, so
+            # running this task twice for an audit has no further effect.
+            result = db.execute(
+                text(
+                    """
+                    UPDATE audits
+                    SET report_json = COALESCE(
+                            CAST(:report AS jsonb),
+                            (report_json - 'status' - 'audit_id')
+                            || jsonb_build_object(
+                                'summary',
+                                (report_json -> 'summary') || CAST(:summary AS jsonb)
+                            )
+                            || CAST(:external_links AS jsonb)
+                        ),
+                        status = 'COMPLETE',
+                        completed_at = :completed_at
+                    WHERE id = :audit_id AND status NOT IN :final_statuses
+                    RETURNING id, status, url, user_id, user_audit_report_request_id,
+                        created_at, completed_at, error_message, technical_error,
+                        CASE WHEN page_level_report IS NULL THEN report_json
+                            ELSE report_json || jsonb_build_object(
+                                'page_level_report', page_level_report
+                            )
+                        END AS full_report_json
+                    """
+                ).bindparams(bindparam("final_statuses", expanding=True)),
+                {
+                    "report": (
+                        orjson.dumps(report).decode() if report is not None else None
+                    ),
+                    "summary": orjson.dumps(external_summary).decode(),
+                    "external_links": orjson.dumps(external_links).decode(),
+                    "completed_at": datetime.datetime.utcnow(),
+                    "audit_id": audit_id,
+                    "final_statuses": FINAL_AUDIT_STATUSES,
+                },
+            )
+            completed_audit = result.first()
+            if completed_audit is None:
+                # A redelivered or repeated save must not rewrite the report or
+                # queue a second dashboard callback
+                task_logger.log(
+                    "warning",
+                    "Audit not found or already in a final state, skipping final save",
+                )
+                return
 
-            audit.report_json = final_report_blob
-            audit.status = "COMPLETE"
-            audit.completed_at = datetime.datetime.utcnow()
-            db.commit()
-            task_logger.log("info", "Successfully saved final report")
-
+            # The callback is stored in the same transaction as the COMPLETE
+            # status, built from the row the UPDATE returned, so a crash or a
+            # broker outage after the commit can't lose it.
             if settings.DASHBOARD_CALLBACK_URL:
-                task_logger.log(
-                    "info", "Dashboard callback URL configured, queueing callback task"
+                callback_id = _queue_dashboard_callback(
+                    db, audit_id, _build_callback_payload(completed_audit)
                 )
-                send_report_to_dashboard.delay(audit_id=audit_id)
-            else:
-                task_logger.log("info", "No dashboard callback URL configured")
+
+            db.commit()
+            task_logger.log("info", "Successfully saved final report")
         except Exception as e:
             task_logger.log(
                 "error",
                 "Failed to save final report",
                 {"error": str(e), "exception_type": type(e).__name__},
             )
-            if audit:
-                audit.status = "ERROR"
-                db.commit()
+            db.rollback()
+            db.execute(
+                update(Audit)
+                .where(Audit.id == audit_id, Audit.status.not_in(FINAL_AUDIT_STATUSES))
+                .values(status="ERROR")
+            )
+            db.commit()
         finally:
             db.close()
 
+        if callback_id is not None:
+            task_logger.log(
+                "info", "Dashboard callback URL configured, queueing callback task"
+            )
+            _send_queued_callback(audit_id, callback_id)
+        elif not settings.DASHBOARD_CALLBACK_URL:
+            task_logger.log("info", "No dashboard callback URL configured")
+
         # Cleanup crawl output file (only if not saving to disk)
         if crawl_output_file and should_cleanup_file(crawl_output_file):
             try:
@@ -1049,11 +1359,170 @@ def save_final_report(self, previous_task_output: dict, audit_id: int):
             )
 
 
-@celery_app.task(bind=True)
-def send_report_to_dashboard(self, audit_id: int):
+def _schedule_dashboard_retry(
+    callback: DashboardCallback,
+    now: datetime.datetime,
+    exc: Exception,
+    retry_after: int = None,
+) -> None:
+    """
+    Back off a failed callback, or give up once it is out of attempts.
+
+    A `retry_after` hint from the dashboard replaces the exponential backoff,
+    capped at DASHBOARD_CALLBACK_BACKOFF_MAX_SECONDS.
+    """
+    callback.last_error = str(exc)
+    if callback.attempts >= DASHBOARD_CALLBACK_MAX_ATTEMPTS:
+        callback.status = "FAILED"
+        logging_manager.log_audit_event(
+            callback.audit_id,
+            "error",
+            "Request to dashboard failed. Giving up.",
+            {"error": str(exc), "attempts": callback.attempts},
+            task_name="send_report_to_dashboard",
+        )
+        return
+    if retry_after is not None:
+        retry_in = min(retry_after, DASHBOARD_CALLBACK_BACKOFF_MAX_SECONDS)
+    else:
+        retry_in = round(_dashboard_retry_delay(callback.attempts))
+    callback.next_attempt_at = now + datetime.timedelta(seconds=retry_in)
+    logging_manager.log_audit_event(
+        callback.audit_id,
+        "error",
+        "Request to dashboard failed. Retrying.",
+        {
+            "error": str(exc),
+            "attempts": callback.attempts,
+            "next_retry_in_seconds": retry_in,
+        },
+        task_name="send_report_to_dashboard",
+    )
+
+
+def _attempt_dashboard_callback(callback: DashboardCallback) -> None:
+    """
+    POST a stored callback payload and record the outcome on the row.
+    The caller is responsible for committing the session.
+    """
+    now = datetime.datetime.utcnow()
+    callback.attempts += 1
+
+    headers = {
+        "Content-Type": "application/json",
+        "X-API-KEY": settings.DASHBOARD_API_KEY,
+        # Stable for the lifetime of the callback so the dashboard can drop
+        # redeliveries of a POST it already processed.
+        "Idempotency-Key": f"audit_{callback.audit_id}_callback_{callback.id}",
+    }
+
+    try:
+        response = _dashboard_client.post(
+            settings.DASHBOARD_CALLBACK_URL,
+            content=callback.payload,
+            headers=headers,
+        )
+        response.raise_for_status()
+    except httpx.HTTPStatusError as exc:
+        status_code = exc.response.status_code
+        if status_code >= 500 or status_code in DASHBOARD_RETRYABLE_STATUSES:
+            # 429 and 503 usually say when the dashboard will take requests
+            # again; retrying sooner would just be rejected and use up an attempt.
+            _schedule_dashboard_retry(
+                callback, now, exc, _retry_after_seconds(exc.response, now)
+            )
+            return
+        # The dashboard rejected the request itself; sending the same payload
+        # again would only be rejected again.
+        callback.status = "FAILED"
+        callback.last_error = str(exc)
+        logging_manager.log_audit_event(
+            callback.audit_id,
+            "error",
+            "Dashboard rejected the report. Not retrying.",
+            {"response_status": status_code, "attempts": callback.attempts},
+            task_name="send_report_to_dashboard",
+        )
+        return
+    except httpx.RequestError as exc:
+        _schedule_dashboard_retry(callback, now, exc)
+        return
+    except Exception as e:
+        # For non-transport errors we don't retry, to avoid poison pills.
+        callback.status = "FAILED"
+        callback.last_error = str(e)
+        logging_manager.log_audit_event(
+            callback.audit_id,
+            "error",
+            "Unexpected error sending report to dashboard",
+            {"error": str(e), "exception_type": type(e).__name__},
+            task_name="send_report_to_dashboard",
+        )
+        return
+
+    callback.status = "DELIVERED"
+    callback.delivered_at = now
+    callback.last_error = None
+    logging_manager.log_audit_event(
+        callback.audit_id,
+        "info",
+        "Successfully sent report to dashboard",
+        {"response_status": response.status_code, "attempts": callback.attempts},
+        task_name="send_report_to_dashboard",
+    )
+
+
+def _deliver_due_callbacks(db, *criteria, limit: int = None) -> int:
+    """
+    Claim pending callbacks that are due (optionally narrowed by `criteria`),
+    attempt each one and return how many were claimed.
+    """
+    now = datetime.datetime.utcnow()
+    query = (
+        db.query(DashboardCallback)
+        .filter(
+            DashboardCallback.status == "PENDING",
+            DashboardCallback.next_attempt_at <= now,
+            *criteria,
+        )
+        .order_by(DashboardCallback.next_attempt_at)
+    )
+    if limit is not None:
+        query = query.limit(limit)
+    callbacks = query.with_for_update(skip_locked=True).all()
+    if not callbacks:
+        return 0
+
+    # Lease the claimed rows so the row locks can be released before the
+    # (slow) HTTP calls without an overlapping sweep picking them up too.
+    lease_until = now + datetime.timedelta(seconds=DASHBOARD_CALLBACK_LEASE_SECONDS)
+    for callback in callbacks:
+        callback.next_attempt_at = lease_until
+    db.commit()
+
+    for callback in callbacks:
+        _attempt_dashboard_callback(callback)
+        db.commit()
+
+    return len(callbacks)
+
+
+@celery_app.task(bind=True, ignore_result=True)
+def send_report_to_dashboard(
+    self, audit_id: int, callback_id: int = None, callback_payload: dict = None
+):
     """
     Sends the final report to the pre-configured dashboard callback URL.
-    This task will retry if the dashboard is unavailable.
+
+    The audit tasks store the callback in the `dashboard_callbacks` table
+    together with the audit's final status and pass its `callback_id`; this
+    task makes the first POST right away. Failed deliveries are picked up by
+    the `retry_dashboard_callbacks` beat task, which re-sends the stored bytes
+    without touching the audit again.
+
+    Messages without a `callback_id` (queued before callbacks were stored with
+    the audit) store the callback here first, from `callback_payload` or, if
+    that is missing too, from the database.
     """
     task_context = {
         "task_id": self.request.id,
@@ -1069,91 +1538,84 @@ def send_report_to_dashboard(self, audit_id: int):
 
         task_logger.log("info", "Starting dashboard callback")
 
+        if not settings.DASHBOARD_CALLBACK_URL or not settings.DASHBOARD_API_KEY:
+            task_logger.log(
+                "warning", "Dashboard callback URL or API key not configured"
+            )
+            return
+
         db = SessionLocal()
         try:
-            audit = db.query(Audit).filter(Audit.id == audit_id).first()
-            if not audit:
-                task_logger.log("error", "Audit not found for dashboard callback")
-                return
-
-            if not settings.DASHBOARD_CALLBACK_URL or not settings.DASHBOARD_API_KEY:
-                task_logger.log(
-                    "warning", "Dashboard callback URL or API key not configured"
+            if callback_id is None:
+                if callback_payload is None:
+                    callback_payload = _load_callback_payload(audit_id)
+                    if callback_payload is None:
+                        task_logger.log(
+                            "error", "Audit not found for dashboard callback"
+                        )
+                        return
+                callback_id = _queue_dashboard_callback(
+                    db, audit_id, callback_payload
                 )
-                return
-
-            # The data in audit.report_json is now clean. We construct the payload
-            # using the direct attributes from the model for clarity and consistency.
-            # Order matches the API response exactly for consistency
-            callback_payload = {
-                "audit_id": audit.id,
-                "status": audit.status,
-                "url": audit.url,
-                "user_id": audit.user_id,
-                "user_audit_report_request_id": audit.user_audit_report_request_id,
-                "created_at": audit.created_at.isoformat(),
-                "completed_at": (
-                    audit.completed_at.isoformat() if audit.completed_at else None
-                ),
-                "error_message": audit.error_message,
-                "technical_error": audit.technical_error,
-                "report_json": audit.report_json,
-            }
-
-            headers = {
-                "Content-Type": "application/json",
-                "X-API-KEY": settings.DASHBOARD_API_KEY,
-            }
+                db.commit()
 
             task_logger.log(
                 "info",
                 "Sending report to dashboard",
                 {
                     "dashboard_url": settings.DASHBOARD_CALLBACK_URL,
-                    "audit_status": audit.status,
+                    "callback_id": callback_id,
                 },
             )
 
-            with httpx.Client() as client:
-                response = client.post(
-                    settings.DASHBOARD_CALLBACK_URL,
-                    json=callback_payload,
-                    headers=headers,
-                    timeout=30.0,
-                )
-                response.raise_for_status()
+            # Claimed like the sweep claims callbacks, so whichever gets to the
+            # row first sends it and the other skips it
+            if not _deliver_due_callbacks(db, DashboardCallback.id == callback_id):
                 task_logger.log(
                     "info",
-                    "Successfully sent report to dashboard",
-                    {"response_status": response.status_code},
+                    "Callback not due or already taken by the retry sweep, skipping",
                 )
 
-        except httpx.RequestError as exc:
-            task_logger.log(
-                "error",
-                "Request to dashboard failed. Retrying.",
-                {
-                    "error": str(exc),
-                    "retry_count": self.request.retries,
-                    "next_retry_in_seconds": 60 * (2**self.request.retries),
-                },
-            )
-            # Exponential backoff, retry in 60s, 120s, 240s, etc. max 5 times.
-            raise self.retry(
-                exc=exc, countdown=60 * (2**self.request.retries), max_retries=5
-            )
         except Exception as e:
+            db.rollback()
             task_logger.log(
                 "error",
-                "Unexpected error sending report to dashboard",
+                "Unexpected error queueing report for dashboard",
                 {"error": str(e), "exception_type": type(e).__name__},
             )
-            # For non-HTTP errors, you might not want to retry, or use a different strategy.
-            # Here we will not retry for unexpected errors to avoid poison pills.
         finally:
             db.close()
 
 
+@celery_app.task(ignore_result=True)
+def retry_dashboard_callbacks(batch_size: int = 100):
+    """
+    Periodic (celery beat) sweep that redelivers pending dashboard callbacks
+    whose next attempt is due.
+    """
+    if not settings.DASHBOARD_CALLBACK_URL or not settings.DASHBOARD_API_KEY:
+        return
+
+    db = SessionLocal()
+    try:
+        processed = _deliver_due_callbacks(db, limit=batch_size)
+        if not processed:
+            return
+
+        logging_manager.log_system_event(
+            "celery",
+            "info",
+            f"Dashboard callback sweep processed {processed} pending callbacks",
+        )
+    except Exception as e:
+        db.rollback()
+        logging_manager.log_system_event(
+            "celery", "error", f"Dashboard callback sweep failed: {e}"
+        )
+    finally:
+        db.close()
+
+
 @celery_app.task
 def run_full_audit(audit_id: int, url: str, max_pages: int = 100):
     task_chain = chain(
@@ -1165,402 +1627,496 @@ def run_full_audit(audit_id: int, url: str, max_pages: int = 100):
     task_chain.apply_async()
 
 
-@celery_app.task
-def debug_task():
-    print("Debug task executed.")
-
-
 # --- Async External Link Checking Functions ---
 
+# Each worker thread keeps one event loop for its link checks instead of
+# creating and tearing one down per audit. Thread-local because Celery may run
+# tasks in a thread pool (-P threads) as well as in prefork processes.
+_link_check_local = threading.local()
+_link_check_runners = []
+
+
+def _link_check_runner() -> asyncio.Runner:
+    runner = getattr(_link_check_local, "runner", None)
+    if runner is None:
+        runner = _link_check_local.runner = asyncio.Runner()
+        _link_check_runners.append(runner)
+    return runner
+
+
+# One link check client per event loop, so pooled connections (and their TLS
+# sessions) to hosts that many sites link to survive from one audit to the next
+_link_check_clients = weakref.WeakKeyDictionary()
+
+
+def _link_check_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _link_check_clients.get(loop)
+    if client is None:
+        # Per-host fairness comes from the host semaphores in
+        # check_external_links_async, so the pool only needs an overall bound.
+        # HTTP/2 lets requests to the same host share one connection.
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=50, max_keepalive_connections=20, keepalive_expiry=30.0
+            ),
+            # Unset by default. Deployments without an IPv6 route can set
+            # "0.0.0.0" so connects don't try a host's AAAA records first.
+            local_address=settings.LINK_CHECK_LOCAL_ADDRESS,
+        )
+        client = _link_check_clients[loop] = httpx.AsyncClient(
+            transport=transport,
+            follow_redirects=True,
+            timeout=httpx.Timeout(20.0, connect=5.0),
+        )
+    return client
 
-def chunk_urls_by_domain(urls: list, max_chunk_size: int = 20) -> list:
-    """
-    Intelligently chunk URLs to prevent domain collision.
-    Groups URLs by domain and distributes them across chunks.
-    """
-    domain_groups = defaultdict(list)
 
-    # Group URLs by domain
-    for url in urls:
+@worker_process_shutdown.connect
+def _close_link_check_runners(**kwargs):
+    while _link_check_runners:
+        runner = _link_check_runners.pop()
         try:
-            domain = urlparse(url).netloc
-            domain_groups[domain].append(url)
-        except Exception:
-            # Handle malformed URLs
-            domain_groups["unknown"].append(url)
-
-    chunks = []
+            client = _link_check_clients.pop(runner.get_loop(), None)
+            if client is not None:
+                runner.run(client.aclose())
+            runner.close()
+        except Exception as e:
+            logger.warning(f"Failed to close link check event loop: {e}")
 
-    # For each domain, distribute URLs across different chunks
-    for domain, domain_urls in domain_groups.items():
-        for i, url in enumerate(domain_urls):
-            chunk_index = i % max_chunk_size
 
-            # Ensure we have enough chunks
-            while len(chunks) <= chunk_index:
-                chunks.append([])
+# Prefork children shut down through the signal above; other pools exit
+# through atexit.
+atexit.register(_close_link_check_runners)
 
-            chunks[chunk_index].append(url)
+# Extra HEAD attempts for 5xx responses and transport errors
+HEAD_RETRIES = 2
 
-    # Remove empty chunks and limit chunk sizes
-    final_chunks = []
-    for chunk in chunks:
-        if chunk:
-            # Split large chunks further
-            while len(chunk) > max_chunk_size:
-                final_chunks.append(chunk[:max_chunk_size])
-                chunk = chunk[max_chunk_size:]
-            if chunk:
-                final_chunks.append(chunk)
 
-    return final_chunks
+@lru_cache(maxsize=8192)
+def _host(url: str) -> str:
+    """Lowercase hostname of a URL, memoized since the same links recur across pages."""
+    try:
+        return urlsplit(url).hostname or ""
+    except ValueError:
+        return ""
 
 
-def get_domain_safe_settings(urls: list) -> dict:
+def normalize_url(url: str) -> str:
     """
-    Returns domain-optimized crawler settings.
-    - Single domain: Conservative crawling
-    - Multiple domains: More concurrent
-    - Auth-sensitive domains: Gentle with realistic browser fingerprinting
+    Canonical form of a URL used to deduplicate link checks: lowercase scheme
+    and host, no default port, no trailing slash on the path (the root path
+    is always "/"), no fragment.
     """
+    try:
+        parts = urlsplit(url.strip())
+        scheme = parts.scheme.lower()
+        host = parts.hostname or ""
+        port = parts.port
+    except ValueError:
+        return url
+
+    if ":" in host:  # IPv6 literal
+        host = f"[{host}]"
+    netloc = host
+    if port and (scheme, port) not in (("http", 80), ("https", 443)):
+        netloc = f"{netloc}:{port}"
+    userinfo, at, _ = parts.netloc.rpartition("@")
+    if at:
+        netloc = f"{userinfo}@{netloc}"
+
+    # "/docs" and "/docs/" almost always serve (or redirect to) the same page
+    path = parts.path.rstrip("/") or ("/" if netloc else "")
+
+    return urlunsplit((scheme, netloc, path, parts.query, ""))
+
+
+# Hostname prefixes, domains and paths that call for authentication-sensitive
+# crawling settings.
+_AUTH_SUBDOMAINS = (
+    "account.",
+    "auth.",
+    "login.",
+    "sso.",
+    "admin.",
+    "dashboard.",
+    "portal.",
+    "secure.",
+)
+_CRAWLER_BLOCKERS = frozenset(
+    {
+        "facebook.com",
+        "twitter.com",
+        "x.com",
+        "instagram.com",
+        "linkedin.com",
+    }
+)
+_AUTH_PATHS_RE = re.compile(
+    r"/(?:auth|login|dashboard|admin|account|profile|membership)/"
+)
 
-    def requires_gentle_crawling(url: str) -> bool:
-        """Check if URL requires authentication-sensitive crawling settings."""
-        try:
-            from urllib.parse import urlparse
-
-            parsed = urlparse(url.lower())
-            hostname = parsed.hostname or ""
-            path = parsed.path or ""
-
-            # Authentication subdomain patterns
-            auth_subdomains = [
-                "account.",
-                "auth.",
-                "login.",
-                "sso.",
-                "admin.",
-                "dashboard.",
-                "portal.",
-                "secure.",
-            ]
-            if any(hostname.startswith(subdomain) for subdomain in auth_subdomains):
-                return True
-
-            # Social media and known crawler-blocking domains
-            crawler_blocking_patterns = [
-                "facebook.com",
-                "twitter.com",
-                "x.com",
-                "instagram.com",
-                "linkedin.com",
-            ]
-            if any(pattern in hostname for pattern in crawler_blocking_patterns):
-                return True
-
-            # Authentication path patterns
-            auth_paths = [
-                "/auth/",
-                "/login/",
-                "/dashboard/",
-                "/admin/",
-                "/account/",
-                "/profile/",
-                "/membership/",
-            ]
-            if any(auth_path in path for auth_path in auth_paths):
-                return True
-
-            return False
-        except Exception:
-            return False
 
-    domains = set()
-    auth_domains_found = []
+@lru_cache(maxsize=8192)
+def requires_gentle_crawling(url: str) -> bool:
+    """Check if URL requires authentication-sensitive crawling settings."""
+    try:
+        parsed = urlparse(url.lower())
+        hostname = parsed.hostname or ""
+        path = parsed.path or ""
+
+        # Authentication subdomain patterns
+        if hostname.startswith(_AUTH_SUBDOMAINS):
+            return True
+
+        # Social media and known crawler-blocking domains
+        if any(blocker in hostname for blocker in _CRAWLER_BLOCKERS):
+            return True
+
+        # Authentication path patterns
+        if _AUTH_PATHS_RE.search(path):
+            return True
 
-    for url in urls:
+        return False
+    except Exception:
+        return False
+
+
+# Browser-like headers sent with every external link check
+LINK_CHECK_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
+    ),
+    "Accept": (
+        "text/html,application/xhtml+xml,application/xml;q=0.9,"
+        "image/avif,image/webp,image/apng,*/*;q=0.8,"
+        "application/signed-exchange;v=b3;q=0.7"
+    ),
+    "Accept-Language": "en-US,en;q=0.9,fr;q=0.8,es;q=0.7",
+    "Accept-Encoding": "gzip, deflate, br, zstd",
+    "Cache-Control": "max-age=0",
+    "DNT": "1",
+    "Pragma": "no-cache",
+    "Upgrade-Insecure-Requests": "1",
+    "sec-ch-ua": '"Google Chrome";v="134", "Chromium";v="134", "Not_A Brand";v="24"',
+    "sec-ch-ua-mobile": "?0",
+    "sec-ch-ua-platform": '"Windows"',
+    "sec-fetch-dest": "document",
+    "sec-fetch-mode": "navigate",
+    "sec-fetch-site": "none",
+    "sec-fetch-user": "?1",
+}
+
+# Politeness towards each external host. Links that need gentle crawling
+# (see requires_gentle_crawling) wait longer and get more time to respond.
+LINK_CHECK_CONCURRENCY = 20
+LINK_CHECK_HOST_CONCURRENCY = 2
+LINK_CHECK_DELAY = 1
+GENTLE_LINK_CHECK_DELAY = 3
+# Connecting (including DNS) gets its own, shorter budget so dead hosts fail fast
+LINK_CHECK_TIMEOUT = httpx.Timeout(10.0, connect=5.0)
+GENTLE_LINK_CHECK_TIMEOUT = httpx.Timeout(15.0, connect=8.0)
+# Overall budget for one audit's external link check; links still pending
+# when it runs out are reported as unchecked
+LINK_CHECK_DEADLINE_SECONDS = 600
+
+
+async def _head_check(
+    client: httpx.AsyncClient, url: str, headers: dict, timeout: httpx.Timeout
+) -> dict:
+    """
+    HEAD a URL; the status is -1 if it couldn't be reached.
+
+    Server errors and transport errors are often transient, so they are retried
+    up to HEAD_RETRIES times with full-jitter exponential backoff before the
+    last result is returned.
+    """
+    row = {"url": url, "status": -1, "method_used": "HEAD"}
+    for attempt in range(HEAD_RETRIES + 1):
         try:
-            domain = urlparse(url).netloc
-            domains.add(domain)
-            if requires_gentle_crawling(url):
-                auth_domains_found.append(domain)
+            response = await client.head(url, headers=headers, timeout=timeout)
+        except httpx.TransportError:
+            row = {"url": url, "status": -1, "method_used": "HEAD"}
         except Exception:
-            continue
+            # Invalid URLs and the like won't get better on retry
+            return {"url": url, "status": -1, "method_used": "HEAD"}
+        else:
+            row = {
+                "url": url,
+                "status": response.status_code,
+                "method_used": "HEAD",
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+            }
+            if response.status_code < 500:
+                return row
 
-    # Industry-standard realistic browser headers for 2025
-    realistic_headers = {
-        "Accept": (
-            "text/html,application/xhtml+xml,application/xml;q=0.9,"
-            "image/avif,image/webp,image/apng,*/*;q=0.8,"
-            "application/signed-exchange;v=b3;q=0.7"
-        ),
-        "Accept-Language": "en-US,en;q=0.9,fr;q=0.8,es;q=0.7",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "Cache-Control": "max-age=0",
-        "Connection": "keep-alive",
-        "DNT": "1",
-        "Pragma": "no-cache",
-        "Upgrade-Insecure-Requests": "1",
-        "sec-ch-ua": '"Google Chrome";v="134", "Chromium";v="134", "Not_A Brand";v="24"',
-        "sec-ch-ua-mobile": "?0",
-        "sec-ch-ua-platform": '"Windows"',
-        "sec-fetch-dest": "document",
-        "sec-fetch-mode": "navigate",
-        "sec-fetch-site": "none",
-        "sec-fetch-user": "?1",
-    }
+        if attempt < HEAD_RETRIES:
+            # 0.3s, 1.2s, ... upper bounds with full jitter
+            await asyncio.sleep(random.uniform(0, 0.3 * 4**attempt))
+    return row
 
-    # If we have auth-required domains, use more gentle settings
-    if auth_domains_found:
-        logging_manager.log_system_event(
-            "crawler",
-            "info",
-            (
-                f"Detected authentication-sensitive domains: "
-                f"{len(auth_domains_found)} domains, using gentle settings"
-            ),
-        )
+
+async def _get_fallback_check(
+    client: httpx.AsyncClient, url: str, headers: dict, timeout: httpx.Timeout
+) -> dict:
+    """
+    Perform a GET request for a URL that returned 4xx with HEAD or was unreachable.
+    Only the response headers are read; the body is never downloaded.
+    """
+    try:
+        async with client.stream(
+            "GET", url, headers=headers, timeout=timeout
+        ) as response:
+            final_url = str(response.url)
+            return {
+                "url": url,
+                "status": response.status_code,
+                "method_used": "GET_FALLBACK",  # Mark as fallback
+                "content_type": response.headers.get("content-type", ""),
+                "redirect_url": final_url if final_url != url else None,
+                "etag": response.headers.get("etag"),
+                "last_modified": response.headers.get("last-modified"),
+                "fallback_reason": "HEAD_failed",  # Track why fallback was used
+            }
+    except httpx.TimeoutException:
         return {
-            "ROBOTSTXT_OBEY": False,
-            "USER_AGENT": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                "(KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
-            ),
-            "DOWNLOAD_DELAY": 3,  # Longer delay for auth domains
-            "CONCURRENT_REQUESTS_PER_DOMAIN": 1,  # More conservative
-            "RANDOMIZE_DOWNLOAD_DELAY": True,
-            "DOWNLOAD_TIMEOUT": 15,  # Longer timeout
-            "DNS_TIMEOUT": 8,
-            "RETRY_ENABLED": True,  # Enable retries
-            "RETRY_TIMES": 2,
-            "REDIRECT_ENABLED": True,
-            "REDIRECT_MAX_TIMES": 5,
-            "DEFAULT_REQUEST_HEADERS": realistic_headers,
+            "url": url,
+            "status": -1,  # Still timeout with GET
+            "method_used": "GET_FALLBACK_TIMEOUT",
+            "error": "Timeout",
+            "fallback_reason": "HEAD_failed_GET_timeout",
         }
-
-    # Single domain - conservative approach
-    if len(domains) == 1:
+    except httpx.ConnectError as e:
         return {
-            "ROBOTSTXT_OBEY": False,
-            "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
-            "DOWNLOAD_DELAY": 2,
-            "CONCURRENT_REQUESTS_PER_DOMAIN": 1,
-            "RANDOMIZE_DOWNLOAD_DELAY": True,
-            "DOWNLOAD_TIMEOUT": 12,
-            "DNS_TIMEOUT": 6,
-            "RETRY_ENABLED": True,
-            "RETRY_TIMES": 1,
-            "REDIRECT_ENABLED": True,
-            "DEFAULT_REQUEST_HEADERS": realistic_headers,
+            "url": url,
+            "status": -1,  # Still connection error with GET
+            "method_used": "GET_FALLBACK_CONNECTION_ERROR",
+            "error": f"Connection error: {str(e)}",
+            "fallback_reason": "HEAD_failed_GET_connection_error",
         }
-    else:
-        # Multiple domains - can be more aggressive
+    except httpx.RequestError as e:
         return {
-            "ROBOTSTXT_OBEY": False,
-            "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36",
-            "DOWNLOAD_DELAY": 1,
-            "CONCURRENT_REQUESTS_PER_DOMAIN": 2,
-            "RANDOMIZE_DOWNLOAD_DELAY": True,
-            "DOWNLOAD_TIMEOUT": 10,
-            "DNS_TIMEOUT": 5,
-            "RETRY_ENABLED": True,
-            "RETRY_TIMES": 1,
-            "REDIRECT_ENABLED": True,
-            "DEFAULT_REQUEST_HEADERS": realistic_headers,
+            "url": url,
+            "status": -1,  # Still request error with GET
+            "method_used": "GET_FALLBACK_REQUEST_ERROR",
+            "error": f"Request error: {str(e)}",
+            "fallback_reason": "HEAD_failed_GET_request_error",
+        }
+    except Exception as e:
+        return {
+            "url": url,
+            "status": -1,  # Unknown error with GET
+            "method_used": "GET_FALLBACK_ERROR",
+            "error": f"Unknown error: {str(e)}",
+            "fallback_reason": "HEAD_failed_GET_unknown_error",
         }
 
 
-def run_advertools_chunk(urls: list, output_file: str) -> dict:
+async def check_url(
+    client: httpx.AsyncClient,
+    url: str,
+    headers: dict,
+    timeout: httpx.Timeout,
+    delay: float = 0,
+    cached: dict = None,
+) -> dict:
     """
     Run smart URL checking with HEAD→GET fallback for 4xx errors.
     This matches Google's crawling behavior and eliminates false positives.
-    """
-    try:
-        if not urls:
-            return {"success": True, "urls_processed": 0, "output_file": output_file}
-
-        # Get domain-optimized settings
-        custom_settings = get_domain_safe_settings(urls)
 
-        # First try advertools crawl_headers (HEAD requests)
-        # Create temp filename that ends with .jl as required by advertools
-        temp_head_file = output_file.replace(".jl", ".head_temp.jl")
-        adv.crawl_headers(urls, temp_head_file, custom_settings=custom_settings)
-
-        # Process HEAD results and identify 4xx errors for GET fallback
-        fallback_urls = []
-        final_results = []
-
-        # Read HEAD results
-        if os.path.exists(temp_head_file):
-            head_df = pd.read_json(temp_head_file, lines=True)
-
-            for _, row in head_df.iterrows():
-                status = row.get("status", -1)
-                url = row.get("url", "")
-
-                # If 4xx error OR unreachable (-1), mark for GET fallback
-                if 400 <= status < 500 or status == -1:
-                    fallback_urls.append(url)
-                else:
-                    # Keep non-4xx/non-unreachable results as-is
-                    final_results.append(row.to_dict())
-
-            # Clean up temporary file
-            os.remove(temp_head_file)
-
-        # Perform GET fallback for 4xx errors
-        if fallback_urls:
-            get_results = run_get_fallback_check(fallback_urls, custom_settings)
-            final_results.extend(get_results)
-
-        # Write final results to output file
-        if final_results:
-            final_df = pd.DataFrame(final_results)
-            final_df.to_json(output_file, orient="records", lines=True)
-        else:
-            # Create empty file if no results
-            with open(output_file, "w"):
-                pass
-
-        # Cleanup temp files
-        temp_get_file = (
-            temp_head_file.replace(".head_temp.jl", ".get_temp.jl")
-            if fallback_urls
-            else None
-        )
-        for temp_file in [temp_head_file, temp_get_file]:
-            if temp_file and os.path.exists(temp_file):
-                try:
-                    os.remove(temp_file)
-                except OSError:
-                    pass  # Ignore cleanup failures
+    `cached` holds the status/etag/last_modified of an expired link cache entry;
+    the HEAD is then sent as a conditional request and a 304 reuses the cached
+    status. `delay` is a politeness pause taken after each request, so callers
+    should hold their per-host limit while awaiting this.
+    """
 
+    async def polite_delay():
+        # Same spread as Scrapy's RANDOMIZE_DOWNLOAD_DELAY (0.5x to 1.5x)
+        if delay > 0:
+            await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+
+    request_headers = headers
+    if cached:
+        request_headers = dict(headers)
+        if cached["etag"]:
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached["last_modified"]:
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+
+    row = await _head_check(client, url, request_headers, timeout)
+    status = row["status"]
+
+    if status == 304 and cached:
+        # Unchanged since the last check; keep the cached status and validators
+        await polite_delay()
         return {
-            "success": True,
-            "urls_processed": len(urls),
-            "fallback_used": len(fallback_urls),
-            "output_file": output_file,
+            "url": url,
+            "status": cached["status"],
+            "method_used": "HEAD_NOT_MODIFIED",
+            "etag": row.get("etag") or cached["etag"],
+            "last_modified": row.get("last_modified") or cached["last_modified"],
         }
 
-    except Exception as e:
-        logging_manager.log_system_event(
-            "crawler", "error", f"Error processing chunk {output_file}: {e}"
-        )
-        return {
-            "success": False,
-            "error": str(e),
-            "urls_processed": 0,
-            "fallback_used": 0,
-            "output_file": output_file,
-        }
+    # Keep non-4xx/non-unreachable results as-is
+    if not (400 <= status < 500 or status == -1):
+        await polite_delay()
+        return row
+
+    # If 4xx error OR unreachable (-1), fall back to GET
+    await polite_delay()
+    row = await _get_fallback_check(client, url, headers, timeout)
+    await polite_delay()
+    return row
+
+
+# Pattern tables for is_likely_false_positive, as (substring, reason) pairs.
+
+# Industry-standard pattern-based detection (not domain-specific)
+_AUTH_URL_PATTERNS = (
+    # Authentication/Session endpoints - universal patterns
+    ("/auth/", "Authentication endpoint"),
+    ("/login/", "Login endpoint"),
+    ("/signin/", "Sign-in endpoint"),
+    ("/logout/", "Logout endpoint"),
+    ("/dashboard/", "User dashboard - typically requires authentication"),
+    ("/profile/", "User profile - requires authentication"),
+    ("/account/", "Account management - requires authentication"),
+    ("/membership/", "Membership area - requires authentication"),
+    ("/admin/", "Admin area - requires authentication"),
+    ("/user/", "User-specific content"),
+    ("/my-", 'User-specific "my" pages'),
+    ("/settings/", "User settings - requires authentication"),
+    # API endpoints that typically require authentication
+    ("/api/user", "User API endpoint"),
+    ("/api/auth", "Authentication API"),
+    ("/api/account", "Account API"),
+    ("/api/profile", "Profile API"),
+    ("/api/dashboard", "Dashboard API"),
+    # Session/Token related patterns
+    ("sessionid=", "Contains session identifier"),
+    ("token=", "Contains authentication token"),
+    ("auth_token=", "Contains auth token parameter"),
+    ("access_token=", "Contains access token"),
+    # Common authentication URL patterns
+    ("oauth", "OAuth authentication flow"),
+    ("sso/", "Single Sign-On endpoint"),
+    ("saml/", "SAML authentication"),
+    ("jwt/", "JWT token endpoint"),
+)
 
+# Subdomain patterns that typically require authentication
+_AUTH_SUBDOMAIN_PATTERNS = (
+    "account.",  # account.domain.com
+    "auth.",  # auth.domain.com
+    "login.",  # login.domain.com
+    "sso.",  # sso.domain.com
+    "admin.",  # admin.domain.com
+    "dashboard.",  # dashboard.domain.com
+    "portal.",  # portal.domain.com
+    "app.",  # app.domain.com (often requires login)
+    "my.",  # my.domain.com
+    "user.",  # user.domain.com
+    "member.",  # member.domain.com
+    "secure.",  # secure.domain.com
+)
 
-def run_get_fallback_check(urls: list, custom_settings: dict) -> list:
-    """
-    Perform GET requests for URLs that returned 4xx with HEAD or were unreachable.
-    This matches Google's behavior and eliminates false positives.
-    """
-    results = []
+# Social media and major platforms that block crawlers (404/403 errors)
+_SOCIAL_MEDIA_PATTERNS = (
+    ("facebook.com", "Facebook blocks automated requests"),
+    ("twitter.com", "Twitter blocks automated access"),
+    ("x.com", "X (Twitter) blocks automated access"),
+    ("instagram.com", "Instagram blocks automated access"),
+    ("linkedin.com", "LinkedIn blocks automated access"),
+    ("tiktok.com", "TikTok blocks automated access"),
+    ("youtube.com/user/", "YouTube user pages block crawlers"),
+    ("github.com/settings", "GitHub settings require authentication"),
+    ("pinterest.com", "Pinterest blocks automated access"),
+    ("snapchat.com", "Snapchat blocks automated access"),
+)
 
-    # Use httpx for GET requests with same settings as advertools
-    timeout = custom_settings.get("DOWNLOAD_TIMEOUT", 30)
-    user_agent = custom_settings.get(
-        "USER_AGENT", "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-    )
-    delay = custom_settings.get("DOWNLOAD_DELAY", 1)
+# Marketing and tracking domains that commonly block crawlers
+_MARKETING_TRACKING_PATTERNS = (
+    ("attn.tv", "Marketing tracking domain blocks crawlers"),
+    ("doubleclick.net", "Google advertising tracking"),
+    ("googlesyndication.com", "Google ads tracking"),
+    ("googletagmanager.com", "Google Tag Manager"),
+    ("googleadservices.com", "Google advertising"),
+    ("facebook.com/tr", "Facebook pixel tracking"),
+    ("analytics.google.com", "Google Analytics"),
+    ("google-analytics.com", "Google Analytics"),
+    ("amplitude.com", "Analytics tracking"),
+    ("mixpanel.com", "Analytics tracking"),
+    ("segment.com", "Analytics tracking"),
+    ("hotjar.com", "User analytics"),
+    ("zendesk.com/embeddable", "Zendesk widget"),
+    ("intercom.io", "Customer support widget"),
+    (".tracking.", "Tracking domain"),
+    (".analytics.", "Analytics domain"),
+)
 
-    headers = {
-        "User-Agent": user_agent,
-        "Accept": (
-            "text/html,application/xhtml+xml,application/xml;q=0.9,"
-            "image/webp,*/*;q=0.8"
-        ),
-        "Accept-Language": "en-US,en;q=0.5",
-        "Accept-Encoding": "gzip, deflate, br, zstd",
-        "DNT": "1",
-        "Connection": "keep-alive",
-        "Upgrade-Insecure-Requests": "1",
-        "Sec-Fetch-Dest": "document",
-        "Sec-Fetch-Mode": "navigate",
-        "Sec-Fetch-Site": "none",
-        "Sec-Fetch-User": "?1",
-        "Cache-Control": "max-age=0",
-    }
+# Partner/redirect domains that require proper referrers
+_PARTNER_REDIRECT_PATTERNS = (
+    ("/go/", "Partner redirect link requires referrer"),
+    ("/redirect/", "Redirect endpoint requires referrer"),
+    ("/r/", "Short redirect link"),
+    ("/link/", "Link redirect"),
+    ("/out/", "Outbound link redirect"),
+    ("/track/", "Tracking redirect"),
+    ("/click/", "Click tracking"),
+    ("hp.com/go/", "HP partner redirect requires referrer"),
+    ("hp.com/support/", "HP support partner link requires referrer"),
+    ("adobe.com/go/", "Adobe partner redirect"),
+    ("microsoft.com/en-us/p/", "Microsoft partner link"),
+    ("amazon.com/dp/", "Amazon product link may require referrer"),
+)
 
-    with httpx.Client(
-        headers=headers, timeout=timeout, follow_redirects=True
-    ) as client:
-        for url in urls:
-            try:
-                # Add delay between requests
-                if delay > 0:
-                    time.sleep(delay)
-
-                # Perform GET request
-                response = client.get(url)
-
-                result = {
-                    "url": url,
-                    "status": response.status_code,
-                    "method_used": "GET_FALLBACK",  # Mark as fallback
-                    "content_type": response.headers.get("content-type", ""),
-                    "size": len(response.content) if response.content else 0,
-                    "redirect_url": str(response.url) if response.url != url else None,
-                    "fallback_reason": "HEAD_failed",  # Track why fallback was used
-                }
+# Subsidiary and enterprise domains that often have bot protection
+_SUBSIDIARY_ENTERPRISE_PATTERNS = (
+    ("dacor.com", "Samsung subsidiary with bot protection"),
+    ("harman.com", "Samsung subsidiary"),
+    ("joyent.com", "Samsung subsidiary"),
+    ("smartthings.com", "Samsung subsidiary"),
+    ("viv.ai", "Samsung subsidiary"),
+    (".enterprise.", "Enterprise subdomain"),
+    (".corp.", "Corporate subdomain"),
+    (".internal.", "Internal subdomain"),
+    (".intranet.", "Intranet subdomain"),
+)
 
-                results.append(result)
+# CDN and asset domains that may block direct access
+_CDN_ASSET_PATTERNS = (
+    (".cloudfront.net", "AWS CloudFront CDN"),
+    (".fastly.com", "Fastly CDN"),
+    (".jsdelivr.net", "jsDelivr CDN"),
+    (".unpkg.com", "unpkg CDN"),
+    (".bootstrapcdn.com", "Bootstrap CDN"),
+    ("assets.", "Asset subdomain"),
+    ("static.", "Static asset subdomain"),
+    ("cdn.", "CDN subdomain"),
+    ("media.", "Media subdomain"),
+)
 
-            except httpx.TimeoutException:
-                results.append(
-                    {
-                        "url": url,
-                        "status": -1,  # Still timeout with GET
-                        "method_used": "GET_FALLBACK_TIMEOUT",
-                        "error": "Timeout",
-                        "fallback_reason": "HEAD_failed_GET_timeout",
-                    }
-                )
-            except httpx.ConnectError as e:
-                results.append(
-                    {
-                        "url": url,
-                        "status": -1,  # Still connection error with GET
-                        "method_used": "GET_FALLBACK_CONNECTION_ERROR",
-                        "error": f"Connection error: {str(e)}",
-                        "fallback_reason": "HEAD_failed_GET_connection_error",
-                    }
-                )
-            except httpx.RequestError as e:
-                results.append(
-                    {
-                        "url": url,
-                        "status": -1,  # Still request error with GET
-                        "method_used": "GET_FALLBACK_REQUEST_ERROR",
-                        "error": f"Request error: {str(e)}",
-                        "fallback_reason": "HEAD_failed_GET_request_error",
-                    }
-                )
-            except Exception as e:
-                results.append(
-                    {
-                        "url": url,
-                        "status": -1,  # Unknown error with GET
-                        "method_used": "GET_FALLBACK_ERROR",
-                        "error": f"Unknown error: {str(e)}",
-                        "fallback_reason": "HEAD_failed_GET_unknown_error",
-                    }
-                )
 
-    return results
+# Checked after the authentication subdomain test, in this order
+_PLATFORM_PATTERN_TABLES = (
+    ("Social media", _SOCIAL_MEDIA_PATTERNS),
+    ("Marketing/tracking", _MARKETING_TRACKING_PATTERNS),
+    ("Partner/redirect", _PARTNER_REDIRECT_PATTERNS),
+    ("Subsidiary/enterprise", _SUBSIDIARY_ENTERPRISE_PATTERNS),
+    ("CDN/asset", _CDN_ASSET_PATTERNS),
+)
 
 
-def is_likely_false_positive(url: str, status: int) -> tuple[bool, str]:
+def is_likely_false_positive(url_lower: str, status: int) -> tuple[bool, str]:
     """
     Identify likely false positives using industry-standard heuristic patterns.
     Uses HTTP response analysis and common authentication indicators rather than hardcoded domains.
 
+    The caller passes the URL already lowercased.
+
     Returns (is_false_positive, reason)
     """
     # Never filter unreachable links (-1) as false positives - these are real connectivity issues
@@ -1571,181 +2127,63 @@ def is_likely_false_positive(url: str, status: int) -> tuple[bool, str]:
     if status < 400 or status >= 500:
         return False, ""
 
-    url_lower = url.lower()
-
-    # Industry-standard pattern-based detection (not domain-specific)
-    auth_patterns = [
-        # Authentication/Session endpoints - universal patterns
-        ("/auth/", "Authentication endpoint"),
-        ("/login/", "Login endpoint"),
-        ("/signin/", "Sign-in endpoint"),
-        ("/logout/", "Logout endpoint"),
-        ("/dashboard/", "User dashboard - typically requires authentication"),
-        ("/profile/", "User profile - requires authentication"),
-        ("/account/", "Account management - requires authentication"),
-        ("/membership/", "Membership area - requires authentication"),
-        ("/admin/", "Admin area - requires authentication"),
-        ("/user/", "User-specific content"),
-        ("/my-", 'User-specific "my" pages'),
-        ("/settings/", "User settings - requires authentication"),
-        # API endpoints that typically require authentication
-        ("/api/user", "User API endpoint"),
-        ("/api/auth", "Authentication API"),
-        ("/api/account", "Account API"),
-        ("/api/profile", "Profile API"),
-        ("/api/dashboard", "Dashboard API"),
-        # Session/Token related patterns
-        ("sessionid=", "Contains session identifier"),
-        ("token=", "Contains authentication token"),
-        ("auth_token=", "Contains auth token parameter"),
-        ("access_token=", "Contains access token"),
-        # Common authentication URL patterns
-        ("oauth", "OAuth authentication flow"),
-        ("sso/", "Single Sign-On endpoint"),
-        ("saml/", "SAML authentication"),
-        ("jwt/", "JWT token endpoint"),
-    ]
-
     # Check URL path patterns
-    for pattern, reason in auth_patterns:
+    for pattern, reason in _AUTH_URL_PATTERNS:
         if pattern in url_lower:
             return True, f"Authentication-required: {reason}"
 
-    # Subdomain patterns that typically require authentication
-    auth_subdomains = [
-        "account.",  # account.domain.com
-        "auth.",  # auth.domain.com
-        "login.",  # login.domain.com
-        "sso.",  # sso.domain.com
-        "admin.",  # admin.domain.com
-        "dashboard.",  # dashboard.domain.com
-        "portal.",  # portal.domain.com
-        "app.",  # app.domain.com (often requires login)
-        "my.",  # my.domain.com
-        "user.",  # user.domain.com
-        "member.",  # member.domain.com
-        "secure.",  # secure.domain.com
-    ]
-
     # Check subdomain patterns
     try:
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url_lower)
-        hostname = parsed.hostname or ""
+        hostname = _host(url_lower)
 
-        for subdomain_pattern in auth_subdomains:
-            if hostname.startswith(subdomain_pattern):
-                return True, f"Authentication subdomain: {subdomain_pattern}*"
+        if hostname.startswith(_AUTH_SUBDOMAIN_PATTERNS):
+            subdomain_pattern = next(
+                p for p in _AUTH_SUBDOMAIN_PATTERNS if hostname.startswith(p)
+            )
+            return True, f"Authentication subdomain: {subdomain_pattern}*"
 
     except Exception:
         pass  # If URL parsing fails, continue with other checks
 
-    # Social media and major platforms that block crawlers (404/403 errors)
-    social_media_indicators = [
-        ("facebook.com", "Facebook blocks automated requests"),
-        ("twitter.com", "Twitter blocks automated access"),
-        ("x.com", "X (Twitter) blocks automated access"),
-        ("instagram.com", "Instagram blocks automated access"),
-        ("linkedin.com", "LinkedIn blocks automated access"),
-        ("tiktok.com", "TikTok blocks automated access"),
-        ("youtube.com/user/", "YouTube user pages block crawlers"),
-        ("github.com/settings", "GitHub settings require authentication"),
-        ("pinterest.com", "Pinterest blocks automated access"),
-        ("snapchat.com", "Snapchat blocks automated access"),
-    ]
-
-    for indicator, reason in social_media_indicators:
-        if indicator in url_lower:
-            return True, f"Social media: {reason}"
-
-    # Marketing and tracking domains that commonly block crawlers
-    marketing_tracking_patterns = [
-        ("attn.tv", "Marketing tracking domain blocks crawlers"),
-        ("doubleclick.net", "Google advertising tracking"),
-        ("googlesyndication.com", "Google ads tracking"),
-        ("googletagmanager.com", "Google Tag Manager"),
-        ("googleadservices.com", "Google advertising"),
-        ("facebook.com/tr", "Facebook pixel tracking"),
-        ("analytics.google.com", "Google Analytics"),
-        ("google-analytics.com", "Google Analytics"),
-        ("amplitude.com", "Analytics tracking"),
-        ("mixpanel.com", "Analytics tracking"),
-        ("segment.com", "Analytics tracking"),
-        ("hotjar.com", "User analytics"),
-        ("zendesk.com/embeddable", "Zendesk widget"),
-        ("intercom.io", "Customer support widget"),
-        (".tracking.", "Tracking domain"),
-        (".analytics.", "Analytics domain"),
-    ]
-
-    for pattern, reason in marketing_tracking_patterns:
-        if pattern in url_lower:
-            return True, f"Marketing/tracking: {reason}"
-
-    # Partner/redirect domains that require proper referrers
-    partner_redirect_patterns = [
-        ("/go/", "Partner redirect link requires referrer"),
-        ("/redirect/", "Redirect endpoint requires referrer"),
-        ("/r/", "Short redirect link"),
-        ("/link/", "Link redirect"),
-        ("/out/", "Outbound link redirect"),
-        ("/track/", "Tracking redirect"),
-        ("/click/", "Click tracking"),
-        ("hp.com/go/", "HP partner redirect requires referrer"),
-        ("hp.com/support/", "HP support partner link requires referrer"),
-        ("adobe.com/go/", "Adobe partner redirect"),
-        ("microsoft.com/en-us/p/", "Microsoft partner link"),
-        ("amazon.com/dp/", "Amazon product link may require referrer"),
-    ]
-
-    for pattern, reason in partner_redirect_patterns:
-        if pattern in url_lower:
-            return True, f"Partner/redirect: {reason}"
-
-    # Subsidiary and enterprise domains that often have bot protection
-    subsidiary_enterprise_patterns = [
-        ("dacor.com", "Samsung subsidiary with bot protection"),
-        ("harman.com", "Samsung subsidiary"),
-        ("joyent.com", "Samsung subsidiary"),
-        ("smartthings.com", "Samsung subsidiary"),
-        ("viv.ai", "Samsung subsidiary"),
-        (".enterprise.", "Enterprise subdomain"),
-        (".corp.", "Corporate subdomain"),
-        (".internal.", "Internal subdomain"),
-        (".intranet.", "Intranet subdomain"),
-    ]
-
-    for pattern, reason in subsidiary_enterprise_patterns:
-        if pattern in url_lower:
-            return True, f"Subsidiary/enterprise: {reason}"
-
-    # CDN and asset domains that may block direct access
-    cdn_asset_patterns = [
-        (".cloudfront.net", "AWS CloudFront CDN"),
-        (".fastly.com", "Fastly CDN"),
-        (".jsdelivr.net", "jsDelivr CDN"),
-        (".unpkg.com", "unpkg CDN"),
-        (".bootstrapcdn.com", "Bootstrap CDN"),
-        ("assets.", "Asset subdomain"),
-        ("static.", "Static asset subdomain"),
-        ("cdn.", "CDN subdomain"),
-        ("media.", "Media subdomain"),
-    ]
-
-    for pattern, reason in cdn_asset_patterns:
-        if pattern in url_lower:
-            return True, f"CDN/asset: {reason}"
+    # Social media, tracking, partner redirect, enterprise and CDN patterns
+    for label, patterns in _PLATFORM_PATTERN_TABLES:
+        for pattern, reason in patterns:
+            if pattern in url_lower:
+                return True, f"{label}: {reason}"
 
     return False, ""
 
 
+# Report category for statuses with a dedicated bucket; other 4xx/5xx fall
+# back to range checks in _status_category
+_STATUS_CATEGORIES = {
+    -1: "unreachable_links",
+    404: "broken_links",
+    410: "broken_links",
+    403: "permission_issues",
+    405: "method_issues",
+}
+
+
+def _status_category(status: int):
+    """External link report category for a failing status, or None to skip it."""
+    category = _STATUS_CATEGORIES.get(status)
+    if category:
+        return category
+    if 400 <= status < 500:
+        return "other_client_errors"
+    if 500 <= status < 600:
+        # Server errors (503, 500, 502, etc.) are broken links
+        return "broken_links"
+    return None
+
+
 async def check_external_links_async(
     urls: list, audit_id: int, url_to_source_mapping: dict = None
 ) -> dict:
     """
-    Asynchronously check external links using chunked processing.
-    This prevents blocking and handles domain collisions intelligently.
+    Asynchronously check external links, one task per URL.
+    Per-host limits prevent hammering a single domain while other hosts proceed.
     """
     if not urls:
         logging_manager.log_audit_event(audit_id, "info", "No external links to check")
@@ -1755,8 +2193,32 @@ async def check_external_links_async(
             "permission_issues": [],
             "method_issues": [],
             "other_client_errors": [],
+            "unchecked_links": [],
         }
 
+    # Results arrive in completion order; each report list is put back into
+    # the order the links were given in so reports are stable across runs
+    input_order = {url: position for position, url in enumerate(urls)}
+
+    # Check each link once however it was spelled; results are fanned back out
+    # to the original URLs when the report is built
+    canonical_urls = {}
+    for raw_url in urls:
+        canonical_urls.setdefault(normalize_url(raw_url), []).append(raw_url)
+    # The normalized form is only the grouping key and may not be a URL the
+    # site serves (e.g. "/docs" when only "/docs/" exists), so each group is
+    # requested through the first spelling actually linked
+    url_spellings = {group[0]: group for group in canonical_urls.values()}
+    # Lowercased once here for the false positive patterns
+    lowercase_urls = {url: url.lower() for url in url_spellings}
+    if len(url_spellings) < len(urls):
+        logging_manager.log_audit_event(
+            audit_id,
+            "info",
+            f"Normalized {len(urls)} external links to {len(url_spellings)} unique URLs",
+        )
+    urls = list(url_spellings)
+
     # Limit total URLs to prevent excessive processing
     MAX_EXTERNAL_LINKS = 100
     if len(urls) > MAX_EXTERNAL_LINKS:
@@ -1767,249 +2229,231 @@ async def check_external_links_async(
         )
         urls = urls[:MAX_EXTERNAL_LINKS]
 
-    # Create domain-aware chunks
-    chunks = chunk_urls_by_domain(urls, max_chunk_size=20)
-    logging_manager.log_audit_event(
-        audit_id,
-        "info",
-        f"Processing {len(urls)} external links in {len(chunks)} chunks",
-    )
-
-    # Prepare output files for each chunk
-    chunk_files = [
-        get_results_file_path(f"headers_{audit_id}_chunk_{i}.jl") for i in range(len(chunks))
-    ]
+    # Serve recently verified links from the link cache; only the rest are
+    # checked over the network
+    cached_statuses, validators = link_cache.lookup(urls)
+    if cached_statuses:
+        logging_manager.log_audit_event(
+            audit_id,
+            "info",
+            f"{len(cached_statuses)} external links served from link cache",
+        )
+        urls = [url for url in urls if url not in cached_statuses]
 
-    # Semaphore to limit concurrent chunks (prevents overwhelming the system)
-    semaphore = asyncio.Semaphore(3)  # Max 3 concurrent chunks
+    gentle_urls = [url for url in urls if requires_gentle_crawling(url)]
+    if gentle_urls:
+        logging_manager.log_audit_event(
+            audit_id,
+            "info",
+            f"{len(gentle_urls)} external links need gentle crawling",
+        )
+    gentle_urls = frozenset(gentle_urls)
+
+    # Every URL is its own task. A per-host semaphore keeps us polite to each
+    # host, so a slow host only holds up its own links, and a global one caps
+    # the total number of requests in flight.
+    global_semaphore = asyncio.Semaphore(LINK_CHECK_CONCURRENCY)
+    host_semaphores = defaultdict(
+        lambda: asyncio.Semaphore(LINK_CHECK_HOST_CONCURRENCY)
+    )
 
-    async def process_chunk_async(chunk_urls: list, output_file: str, chunk_id: int):
-        """Process a single chunk asynchronously."""
-        async with semaphore:
+    async def check_one(client: httpx.AsyncClient, url: str):
+        host_semaphore = host_semaphores[_host(url)]
+        if url in gentle_urls:
+            timeout, delay = GENTLE_LINK_CHECK_TIMEOUT, GENTLE_LINK_CHECK_DELAY
+        else:
+            timeout, delay = LINK_CHECK_TIMEOUT, LINK_CHECK_DELAY
+        try:
+            async with host_semaphore, global_semaphore:
+                return await check_url(
+                    client, url, LINK_CHECK_HEADERS, timeout, delay, validators.get(url)
+                )
+        except Exception as e:
+            logging_manager.log_audit_event(
+                audit_id, "error", f"Checking {url} failed with exception: {e}"
+            )
+            return None
+
+    fresh_rows = []
+    # Links the deadline cut off, reported so a truncated check is visible
+    unchecked_urls = []
+
+    async def checked_rows():
+        """
+        Yield each fresh result as soon as its request completes, so merging
+        overlaps with the requests still in flight, then the cache hits.
+        """
+        start_time = time.time()
+        # One pool shared by every URL task, and by later audits on this worker
+        client = _link_check_client()
+        tasks = [asyncio.ensure_future(check_one(client, url)) for url in urls]
+        try:
+            # The merge loop consuming these rows never awaits anything
+            # else, so the deadline can only fire at the await below
+            async with asyncio.timeout(LINK_CHECK_DEADLINE_SECONDS):
+                for next_result in asyncio.as_completed(tasks):
+                    row = await next_result
+                    if row is not None:
+                        fresh_rows.append(row)
+                        yield row
+        except TimeoutError:
+            merged_urls = {row["url"] for row in fresh_rows}
+            finished, unfinished = [], []
+            for url, task in zip(urls, tasks):
+                if task.done():
+                    finished.append(task)
+                else:
+                    task.cancel()
+                    unfinished.append(task)
+                    unchecked_urls.append(url)
+            # Let cancelled requests hand their connections back to the pool
+            await asyncio.gather(*unfinished, return_exceptions=True)
             logging_manager.log_audit_event(
                 audit_id,
-                "info",
-                f"Processing chunk {chunk_id} with {len(chunk_urls)} URLs",
+                "warning",
+                (
+                    f"External link check deadline of {LINK_CHECK_DEADLINE_SECONDS}s "
+                    f"reached; {len(unfinished)} links were not checked"
+                ),
             )
-
-            loop = asyncio.get_event_loop()
-
-            # Run advertools in thread pool to avoid blocking
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                try:
-                    # Set timeout for individual chunk processing
-                    result = await asyncio.wait_for(
-                        loop.run_in_executor(
-                            executor, run_advertools_chunk, chunk_urls, output_file
-                        ),
-                        timeout=300,  # 5 minutes per chunk
-                    )
-                    return result
-                except asyncio.TimeoutError:
-                    logging_manager.log_audit_event(
-                        audit_id, "error", f"Chunk {chunk_id} timed out"
-                    )
-                    return {
-                        "success": False,
-                        "error": "Timeout",
-                        "urls_processed": 0,
-                        "output_file": output_file,
-                    }
-                except Exception as e:
-                    logging_manager.log_audit_event(
-                        audit_id, "error", f"Error processing chunk {chunk_id}: {e}"
-                    )
-                    return {
-                        "success": False,
-                        "error": str(e),
-                        "urls_processed": 0,
-                        "output_file": output_file,
-                    }
-
-    # Process all chunks concurrently
-    start_time = time.time()
-    tasks = [
-        process_chunk_async(chunk, chunk_file, i)
-        for i, (chunk, chunk_file) in enumerate(zip(chunks, chunk_files))
-    ]
-
-    try:
-        # Wait for all chunks with overall timeout
-        chunk_results = await asyncio.wait_for(
-            asyncio.gather(*tasks, return_exceptions=True),
-            timeout=600,  # 10 minutes total
-        )
-    except asyncio.TimeoutError:
+            # Requests that completed just before the deadline but had not been
+            # merged yet still count
+            for task in finished:
+                row = task.result()
+                if row is not None and row["url"] not in merged_urls:
+                    fresh_rows.append(row)
+                    yield row
+
+        elapsed_time = time.time() - start_time
         logging_manager.log_audit_event(
-            audit_id, "error", "Overall external link checking timed out"
+            audit_id,
+            "info",
+            f"External link checking completed in {elapsed_time:.2f} seconds",
         )
-        chunk_results = [
-            {"success": False, "error": "Overall timeout", "output_file": f}
-            for f in chunk_files
-        ]
 
-    elapsed_time = time.time() - start_time
+        # Remember fresh results for later audits
+        link_cache.store(fresh_rows)
+
+        # Cache hits are categorized exactly like freshly checked links
+        for url, status in cached_statuses.items():
+            yield {"url": url, "status": status, "method_used": "CACHE"}
+
     logging_manager.log_audit_event(
         audit_id,
         "info",
-        f"External link checking completed in {elapsed_time:.2f} seconds",
+        f"Checking {len(urls)} external links",
     )
 
-    # Merge results from all chunks
+    # Merge results into the report
     external_links_report = {
         "unreachable_links": [],
         "broken_links": [],
         "permission_issues": [],
         "method_issues": [],
         "other_client_errors": [],
+        "unchecked_links": [],
     }
 
-    successful_chunks = 0
-    total_urls_processed = 0
     total_fallbacks_used = 0
     unreachable_recoveries = 0  # Track successful recoveries from unreachable status
     false_positives_filtered = 0
+    multiple_source_count = 0
+    total_source_instances = 0
 
-    for i, result in enumerate(chunk_results):
-        if isinstance(result, Exception):
-            logging_manager.log_audit_event(
-                audit_id, "error", f"Chunk {i} failed with exception: {result}"
-            )
-            continue
+    async for row in checked_rows():
+        try:
+            status = row.get("status")
+            status = -1 if status is None else int(status)
+            url = row.get("url", "Unknown")
+            method_used = row.get("method_used", "")
+
+            if method_used.startswith("GET_FALLBACK"):
+                total_fallbacks_used += 1
+
+            if 200 <= status <= 399:
+                # Track successful recoveries (GET fallback succeeded where HEAD failed)
+                if method_used.startswith("GET_FALLBACK"):
+                    unreachable_recoveries += 1
+                    logging_manager.log_audit_event(
+                        audit_id,
+                        "info",
+                        f"Recovery success: HEAD failed but GET returned {status} for {url}",
+                    )
+                continue
 
-        if not result.get("success", False):
-            logging_manager.log_audit_event(
-                audit_id,
-                "warning",
-                f"Chunk {i} failed: {result.get('error', 'Unknown error')}",
-            )
-            continue
+            # Check for false positives before categorizing
+            url_lower = lowercase_urls.get(url) or url.lower()
+            is_false_pos, reason = is_likely_false_positive(url_lower, status)
+            if is_false_pos:
+                false_positives_filtered += 1
+                logging_manager.log_audit_event(
+                    audit_id,
+                    "info",
+                    f"Filtered false positive: {url} ({status}) - {reason}",
+                )
+                continue  # Skip this URL
 
-        successful_chunks += 1
-        total_urls_processed += result.get("urls_processed", 0)
-        total_fallbacks_used += result.get("fallback_used", 0)
+            category = _status_category(status)
+            if category is None:
+                continue
 
-        # Process the chunk results
-        chunk_file = result.get("output_file")
-        if chunk_file and os.path.exists(chunk_file):
-            try:
-                headers_df = pd.read_json(chunk_file, lines=True)
-
-                if not headers_df.empty and "status" in headers_df.columns:
-                    headers_df["status"] = headers_df["status"].fillna(-1).astype(int)
-
-                    # Track successful recoveries (GET fallback succeeded where HEAD failed)
-                    if "method_used" in headers_df.columns:
-                        fallback_successes = headers_df[
-                            (
-                                headers_df["method_used"].str.contains(
-                                    "GET_FALLBACK", na=False
-                                )
-                            )
-                            & (headers_df["status"].between(200, 399))
-                        ]
-                    else:
-                        fallback_successes = (
-                            pd.DataFrame()
-                        )  # Empty DataFrame if column doesn't exist
-                    if not fallback_successes.empty:
-                        unreachable_recoveries += len(fallback_successes)
-                        for _, row in fallback_successes.iterrows():
-                            url = row.get("url", "Unknown")
-                            status = row.get("status", "Unknown")
-                            logging_manager.log_audit_event(
-                                audit_id,
-                                "info",
-                                f"Recovery success: HEAD failed but GET returned {status} for {url}",
-                            )
+            # Report every original spelling of the link with its own sources
+            for raw_url in url_spellings.get(url, [url]):
+                # Use actual source URLs from mapping, support multiple sources per URL
+                source_urls = ["External Link Check"]  # Default fallback
+                if url_to_source_mapping and raw_url in url_to_source_mapping:
+                    source_urls = url_to_source_mapping[raw_url]
 
-                    error_headers = headers_df[~headers_df["status"].between(200, 399)]
-
-                    for _, row in error_headers.iterrows():
-                        status = row["status"]
-                        url = row.get("url", "Unknown")
-                        method_used = row.get("method_used", "HEAD_ONLY")
-
-                        # Check for false positives before categorizing
-                        is_false_pos, reason = is_likely_false_positive(url, status)
-                        if is_false_pos:
-                            false_positives_filtered += 1
-                            logging_manager.log_audit_event(
-                                audit_id,
-                                "info",
-                                f"Filtered false positive: {url} ({status}) - {reason}",
-                            )
-                            continue  # Skip this URL
+                external_links_report[category].append(
+                    {
+                        "url": raw_url,
+                        "status": "Unreachable" if status == -1 else status,
+                        "source_urls": source_urls,
+                    }
+                )
 
-                        # Use actual source URLs from mapping, support multiple sources per URL
-                        source_urls = ["External Link Check"]  # Default fallback
-                        if url_to_source_mapping and url in url_to_source_mapping:
-                            source_urls = url_to_source_mapping[url]
+                # Multiple source tracking for the summary
+                source_count = len(source_urls)
+                total_source_instances += source_count
+                if source_count > 1:
+                    multiple_source_count += 1
 
-                        link_info = {
-                            "url": url,
-                            "status": "Unreachable" if status == -1 else status,
-                            "source_urls": source_urls,
-                        }
+        except Exception as e:
+            logging_manager.log_audit_event(
+                audit_id,
+                "error",
+                f"Error processing result for {row.get('url')}: {e}",
+            )
 
-                        if status == -1:
-                            external_links_report["unreachable_links"].append(link_info)
-                        elif status in [404, 410]:
-                            external_links_report["broken_links"].append(link_info)
-                        elif status == 403:
-                            external_links_report["permission_issues"].append(link_info)
-                        elif status == 405:
-                            external_links_report["method_issues"].append(link_info)
-                        elif 400 <= status < 500:
-                            external_links_report["other_client_errors"].append(
-                                link_info
-                            )
-                        elif 500 <= status < 600:
-                            # Server errors (503, 500, 502, etc.) are broken links
-                            external_links_report["broken_links"].append(link_info)
+    # Links cut off by the deadline are listed, with their sources, so the
+    # report shows the check was incomplete
+    for url in unchecked_urls:
+        for raw_url in url_spellings.get(url, [url]):
+            source_urls = ["External Link Check"]
+            if url_to_source_mapping and raw_url in url_to_source_mapping:
+                source_urls = url_to_source_mapping[raw_url]
+            external_links_report["unchecked_links"].append(
+                {"url": raw_url, "status": "Unchecked", "source_urls": source_urls}
+            )
 
-            except Exception as e:
-                logging_manager.log_audit_event(
-                    audit_id,
-                    "error",
-                    f"Error processing results from {chunk_file}: {e}",
-                )
-            finally:
-                # Clean up chunk file (only if not saving to disk)
-                if should_cleanup_file(chunk_file):
-                    try:
-                        os.remove(chunk_file)
-                    except OSError:
-                        pass
+    for links in external_links_report.values():
+        links.sort(key=lambda link: input_order.get(link["url"], len(input_order)))
 
     # Enhanced summary with fallback and recovery statistics
-    summary_msg = f"External link summary: {successful_chunks}/{len(chunks)} chunks successful, {total_urls_processed} URLs processed"
+    summary_msg = f"External link summary: {len(fresh_rows)}/{len(urls)} URLs checked"
     if total_fallbacks_used > 0:
         summary_msg += f", {total_fallbacks_used} GET fallbacks used"
     if unreachable_recoveries > 0:
         summary_msg += (
             f", {unreachable_recoveries} URLs recovered from unreachable status"
         )
+    if cached_statuses:
+        summary_msg += f", {len(cached_statuses)} served from link cache"
     summary_msg += f", {false_positives_filtered} false positives filtered"
+    if unchecked_urls:
+        summary_msg += f", {len(unchecked_urls)} URLs not checked before the deadline"
 
     # Enhanced reporting statistics for multiple source tracking
-    total_broken_urls = (
-        len(external_links_report["broken_links"]) +
-        len(external_links_report["unreachable_links"]) +
-        len(external_links_report["permission_issues"]) +
-        len(external_links_report["method_issues"]) +
-        len(external_links_report["other_client_errors"])
-    )
-    
-    multiple_source_count = 0
-    total_source_instances = 0
-    for category in ["broken_links", "unreachable_links", "permission_issues", "method_issues", "other_client_errors"]:
-        for link in external_links_report[category]:
-            source_count = len(link.get("source_urls", []))
-            total_source_instances += source_count
-            if source_count > 1:
-                multiple_source_count += 1
-    
     if multiple_source_count > 0:
         summary_msg += f", {multiple_source_count} URLs found on multiple pages ({total_source_instances} total instances)"
 
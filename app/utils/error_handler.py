@@ -1,6 +1,8 @@
 import logging
 import re
 import socket
+import time
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 from urllib.parse import urlparse
 
@@ -200,7 +202,53 @@ ERROR_PATTERNS = {
     },
 }
 
+# ERROR_PATTERNS flattened once into (pattern, user message, status) rows, in
+# the same priority order, so classify_error doesn't look up the nested dicts
+_ERROR_PATTERN_TABLE = tuple(
+    (pattern, info["user"], info["status"]) for pattern, info in ERROR_PATTERNS.items()
+)
 
+
+# Hostnames that resolved recently, mapped to when that stops being trusted.
+# Re-audits and retries usually target the same few sites, so this saves a
+# DNS round trip per audit. Only successes are kept so a domain that failed
+# to resolve is retried.
+DNS_CACHE_TTL_SECONDS = 300
+DNS_CACHE_MAX_SIZE = 1024
+_resolved_hostnames: Dict[str, float] = {}
+
+
+def _remember_resolved(hostname: str) -> None:
+    if len(_resolved_hostnames) >= DNS_CACHE_MAX_SIZE:
+        # Drop the oldest entry
+        _resolved_hostnames.pop(next(iter(_resolved_hostnames)))
+    _resolved_hostnames.pop(hostname, None)
+    _resolved_hostnames[hostname] = time.monotonic() + DNS_CACHE_TTL_SECONDS
+
+
+# One resolver per process; building it re-reads the system resolver config.
+# A dead domain is reported within DNS_LIFETIME_SECONDS rather than holding
+# a worker for half a minute.
+DNS_TIMEOUT_SECONDS = 5  # per DNS server
+DNS_LIFETIME_SECONDS = 10  # whole lookup
+_resolver: Optional[dns.resolver.Resolver] = None
+
+
+def _get_resolver() -> dns.resolver.Resolver:
+    global _resolver
+    if _resolver is None:
+        resolver = dns.resolver.Resolver()
+        resolver.timeout = DNS_TIMEOUT_SECONDS
+        resolver.lifetime = DNS_LIFETIME_SECONDS
+        _resolver = resolver
+    return _resolver
+
+
+_HOSTNAME_RE = re.compile(r"^[a-zA-Z0-9.-]+$")
+_INVALID_NETLOC_CHARS = frozenset(" \t\n\r")
+
+
+@lru_cache(maxsize=1024)
 def is_valid_url(url: str) -> Tuple[bool, Optional[str]]:
     """
     Validate URL format and basic reachability.
@@ -229,12 +277,12 @@ def is_valid_url(url: str) -> Tuple[bool, Optional[str]]:
             return False, "URL must include a domain name"
 
         # Check for invalid characters
-        if any(char in parsed.netloc for char in [" ", "\t", "\n", "\r"]):
+        if not _INVALID_NETLOC_CHARS.isdisjoint(parsed.netloc):
             return False, "URL contains invalid characters"
 
         # Basic hostname format validation
         hostname = parsed.netloc.split(":")[0]  # Remove port if present
-        if not re.match(r"^[a-zA-Z0-9.-]+$", hostname):
+        if not _HOSTNAME_RE.match(hostname):
             return False, "Invalid domain name format"
 
         # Check for minimum domain structure
@@ -258,14 +306,13 @@ def check_domain_exists(url: str) -> Tuple[bool, Optional[str]]:
         parsed = urlparse(url)
         hostname = parsed.netloc.split(":")[0]  # Remove port if present
 
-        # Create resolver with explicit timeout settings
-        resolver = dns.resolver.Resolver()
-        resolver.timeout = 15  # 15 second timeout for each DNS server
-        resolver.lifetime = 30  # 30 second total timeout
+        if _resolved_hostnames.get(hostname, 0) > time.monotonic():
+            return True, None
 
         # Try DNS resolution with custom timeout
         try:
-            resolver.resolve(hostname, "A")
+            _get_resolver().resolve(hostname, "A")
+            _remember_resolved(hostname)
             return True, None
         except dns.resolver.NXDOMAIN:
             return False, f"Domain '{hostname}' does not exist"
@@ -276,6 +323,7 @@ def check_domain_exists(url: str) -> Tuple[bool, Optional[str]]:
             # Fall back to socket-based check
             try:
                 socket.gethostbyname(hostname)
+                _remember_resolved(hostname)
                 return True, None
             except socket.gaierror:
                 return False, f"DNS lookup timeout for '{hostname}'"
@@ -284,6 +332,7 @@ def check_domain_exists(url: str) -> Tuple[bool, Optional[str]]:
             # Fall back to socket-based check
             try:
                 socket.gethostbyname(hostname)
+                _remember_resolved(hostname)
                 return True, None
             except socket.gaierror:
                 return False, f"Domain '{hostname}' cannot be resolved"
@@ -309,13 +358,13 @@ def classify_error(error_message: str, url: str = None) -> Dict[str, str]:
     error_lower = error_message.lower()
 
     # Check for known error patterns
-    for pattern, info in ERROR_PATTERNS.items():
+    for pattern, user_message, status in _ERROR_PATTERN_TABLE:
         if pattern in error_lower:
             logger.info(f"Classified error '{pattern}' for URL: {url}")
             return {
-                "user_message": info["user"],
+                "user_message": user_message,
                 "technical_message": error_message,
-                "status": info["status"],
+                "status": status,
             }
 
     # Graceful fallback for unknown errors
@@ -337,7 +386,7 @@ def validate_crawl_output(output_file: str) -> Tuple[bool, Optional[str]]:
     try:
         import os
 
-        import pandas as pd
+        import orjson
 
         if not os.path.exists(output_file):
             return False, "Crawl output file not found"
@@ -345,22 +394,36 @@ def validate_crawl_output(output_file: str) -> Tuple[bool, Optional[str]]:
         if os.path.getsize(output_file) == 0:
             return False, "Crawl output file is empty"
 
+        # Stream the JSON lines instead of loading the whole crawl into a
+        # DataFrame; only the url field is needed here.
+        record_count = 0
+        has_url_field = False
+        has_valid_url = False
         try:
-            df = pd.read_json(output_file, lines=True)
+            with open(output_file, "rb") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    record = orjson.loads(line)
+                    if not isinstance(record, dict):
+                        raise ValueError("Expected a JSON object per line")
+                    record_count += 1
+                    if "url" in record:
+                        has_url_field = True
+                        if record["url"] is not None:
+                            has_valid_url = True
         except Exception as e:
             return False, f"Crawl output file is corrupted: {str(e)}"
 
-        if df.empty:
+        if record_count == 0:
             return False, "Crawl produced no results"
 
         # Check for required columns
-        required_columns = ["url"]
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            return False, f"Crawl output missing required columns: {missing_columns}"
+        if not has_url_field:
+            return False, "Crawl output missing required columns: ['url']"
 
         # Check if we have any valid URLs
-        if df["url"].isna().all() or len(df["url"].dropna()) == 0:
+        if not has_valid_url:
             return False, "Crawl produced no valid URLs"
 
         return True, None
@@ -1,26 +1,54 @@
-import json
+import atexit
 import logging
 import os
+import queue
 import sys
 import time
-from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from threading import Lock
 from typing import Any, Dict, Optional, Union
 
+import orjson
 import psutil
 
 
+# Extra attributes copied from a record when set, in output order
+_OPTIONAL_FIELDS = (
+    "audit_id",
+    "task_name",
+    "task_id",
+    "worker_id",
+    "context",
+    "duration_ms",
+    "memory_mb",
+)
+
+
 class JSONFormatter(logging.Formatter):
     """
     Custom JSON formatter for structured logging.
     Formats log records as JSON with audit context and system metrics.
     """
 
+    # (second, "YYYY-MM-DDTHH:MM:SS") of the last record; a tuple so threads
+    # always read a matching pair
+    _second_cache = (None, "")
+
+    def _timestamp(self, created: float) -> str:
+        """ISO 8601 UTC time of a record, reusing the formatted second."""
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        microsecond = min(round((created - second) * 1_000_000), 999_999)
+        return f"{prefix}.{microsecond:06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         # Base log structure
         log_entry = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._timestamp(record.created),
             "level": record.levelname,
             "message": record.getMessage(),
             "logger": record.name,
@@ -29,20 +57,10 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Add audit context if available
-        if hasattr(record, "audit_id"):
-            log_entry["audit_id"] = record.audit_id
-        if hasattr(record, "task_name"):
-            log_entry["task_name"] = record.task_name
-        if hasattr(record, "task_id"):
-            log_entry["task_id"] = record.task_id
-        if hasattr(record, "worker_id"):
-            log_entry["worker_id"] = record.worker_id
-        if hasattr(record, "context"):
-            log_entry["context"] = record.context
-        if hasattr(record, "duration_ms"):
-            log_entry["duration_ms"] = record.duration_ms
-        if hasattr(record, "memory_mb"):
-            log_entry["memory_mb"] = record.memory_mb
+        fields = record.__dict__
+        for name in _OPTIONAL_FIELDS:
+            if name in fields:
+                log_entry[name] = fields[name]
 
         # Add exception information if present
         if record.exc_info:
@@ -54,7 +72,122 @@ class JSONFormatter(logging.Formatter):
                 ),
             }
 
-        return json.dumps(log_entry, ensure_ascii=False)
+        # orjson writes UTF-8 as-is (like ensure_ascii=False); OPT_NON_STR_KEYS
+        # turns int keys into strings as json.dumps did
+        return orjson.dumps(log_entry, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+class _CloseRoute:
+    """Queued after a logger's last record to close its handlers in order."""
+
+    def __init__(self, logger_name: str, handlers: list):
+        self.logger_name = logger_name
+        self.handlers = handlers
+
+
+class _UnflushedEmit:
+    """
+    Writes records into the stream's buffer without flushing after each one;
+    the listener flushes once the queue runs empty, so a burst of records
+    costs one write() per file instead of one per record.
+    """
+
+    def emit(self, record):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+class _BufferedFileHandler(_UnflushedEmit, logging.FileHandler):
+    pass
+
+
+class _BufferedStreamHandler(_UnflushedEmit, logging.StreamHandler):
+    pass
+
+
+class _LogRouter(logging.Handler):
+    """
+    Runs on the listener thread and passes each record to the file/console
+    handlers registered for its logger.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.routes: Dict[str, list] = {}
+
+    def handle(self, record) -> bool:
+        if isinstance(record, _CloseRoute):
+            # The logger may have been recreated with new handlers since
+            if self.routes.get(record.logger_name) is record.handlers:
+                del self.routes[record.logger_name]
+            for handler in record.handlers:
+                handler.close()
+            return True
+        for handler in self.routes.get(record.name, ()):
+            handler.handle(record)
+        return True
+
+    def flush(self):
+        for handlers in list(self.routes.values()):
+            for handler in handlers:
+                handler.flush()
+
+
+class _BatchingQueueListener(QueueListener):
+    """
+    QueueListener that flushes the handlers whenever the queue runs empty and
+    tracks whether it is running, so records logged after stop() can be
+    written directly instead of being left in a queue nobody reads.
+    """
+
+    def __init__(self, queue, *handlers):
+        super().__init__(queue, *handlers)
+        self.running = False
+        # Held while enqueueing and while stopping, so no record can land
+        # behind the stop sentinel
+        self.lock = Lock()
+
+    def start(self):
+        super().start()
+        self.running = True
+
+    def stop(self):
+        with self.lock:
+            if self.running:
+                super().stop()
+                self.running = False
+
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            for handler in self.handlers:
+                handler.flush()
+            return self.queue.get(block)
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """
+    QueueHandler that, once the listener has stopped (e.g. for records logged
+    by atexit hooks after shutdown()), writes records through the router
+    itself rather than dropping them.
+    """
+
+    def __init__(self, queue, router: _LogRouter):
+        super().__init__(queue)
+        self.router = router
+        self.listener: Optional[_BatchingQueueListener] = None
+
+    def enqueue(self, record):
+        listener = self.listener
+        with listener.lock:
+            if listener.running:
+                self.queue.put_nowait(record)
+                return
+        self.router.handle(record)
+        self.router.flush()
 
 
 class LoggingManager:
@@ -67,12 +200,27 @@ class LoggingManager:
     - Windows-compatible file handling
     - Memory and performance monitoring
     - Future Grafana Loki compatibility
+
+    Loggers only carry a QueueHandler, which formats the record and enqueues
+    it; a background QueueListener does the file and console writes, so
+    logging never blocks a task on disk I/O.
     """
 
     _instance = None
     _lock = Lock()
     _loggers: Dict[str, logging.Logger] = {}
-    _handlers: Dict[str, logging.Handler] = {}
+    _handlers: Dict[str, logging.Handler] = {}  # audit loggers, oldest first
+    # Open audit log files kept per process; beyond this the oldest audit's
+    # logger is released (and transparently reopened if it logs again), so a
+    # long-running worker doesn't accumulate file descriptors
+    MAX_AUDIT_LOGGERS = 128
+    # Created on first use; reset in forked children (Celery prefork) so each
+    # reports its own pid and memory
+    _worker_id: Optional[str] = None
+    _process: Optional[psutil.Process] = None
+    # RSS is sampled at most this often; records in between reuse the value
+    MEMORY_SAMPLE_INTERVAL_SECONDS = 0.05
+    _memory_sample = (float("-inf"), None)  # (monotonic time, MB)
 
     def __new__(cls):
         if cls._instance is None:
@@ -84,9 +232,60 @@ class LoggingManager:
     def __init__(self):
         if not hasattr(self, "_initialized"):
             self._setup_directories()
+            self._setup_queue()
             self._setup_system_loggers()
             self._initialized = True
 
+    def _setup_queue(self):
+        """Create the shared queue handler and start the writer thread."""
+        self._router = _LogRouter()
+        # Records are JSON-formatted here, in the logging thread; the real
+        # handlers write the resulting message as-is
+        self._queue_handler = _ListenerQueueHandler(queue.SimpleQueue(), self._router)
+        self._queue_handler.setFormatter(JSONFormatter())
+        self._start_listener()
+
+    def _start_listener(self):
+        self._listener = _BatchingQueueListener(
+            self._queue_handler.queue, self._router
+        )
+        self._queue_handler.listener = self._listener
+        self._listener.start()
+
+    def _restart_listener_in_child(self):
+        # Forked children (Celery prefork) don't inherit the writer thread, and
+        # the parent's queue may have been mid-operation at fork time
+        self._queue_handler.queue = queue.SimpleQueue()
+        self._start_listener()
+
+    def _hold_handlers_for_fork(self):
+        # The file and console handlers keep written records in their stream
+        # buffers until the next flush, and a forked child inherits those
+        # buffers. Flush them and keep each handler locked until the fork is
+        # done, so the writer thread can't buffer more in between; otherwise
+        # the child would write the parent's pending lines a second time.
+        self._fork_held_handlers = [
+            handler
+            for handlers in list(self._router.routes.values())
+            for handler in handlers
+        ]
+        for handler in self._fork_held_handlers:
+            handler.acquire()
+            handler.flush()
+
+    def _release_handlers_after_fork(self):
+        for handler in self._fork_held_handlers:
+            handler.release()
+        self._fork_held_handlers = []
+
+    def shutdown(self):
+        """
+        Write out queued records and stop the writer thread; records logged
+        afterwards are written synchronously.
+        """
+        self._listener.stop()
+        self._router.flush()
+
     def _setup_directories(self):
         """Create logging directory structure."""
         directories = [
@@ -120,15 +319,14 @@ class LoggingManager:
         if logger.handlers:
             return logger
 
-        # File handler with JSON formatting
-        handler = logging.FileHandler(log_file, encoding="utf-8")
-        handler.setFormatter(JSONFormatter())
-        logger.addHandler(handler)
+        # File handler for the JSON lines
+        handler = _BufferedFileHandler(log_file, encoding="utf-8")
 
         # Also log to console for development
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(JSONFormatter())
-        logger.addHandler(console_handler)
+        console_handler = _BufferedStreamHandler(sys.stdout)
+
+        self._router.routes[logger.name] = [handler, console_handler]
+        logger.addHandler(self._queue_handler)
 
         return logger
 
@@ -160,11 +358,14 @@ class LoggingManager:
             if logger.handlers:
                 logger.handlers.clear()
 
+            while len(self._handlers) >= self.MAX_AUDIT_LOGGERS:
+                self._release_audit_logger(next(iter(self._handlers)))
+
             # File handler for this audit
             log_file = f"logs/workers/worker_{audit_id}.log"
-            handler = logging.FileHandler(log_file, encoding="utf-8")
-            handler.setFormatter(JSONFormatter())
-            logger.addHandler(handler)
+            handler = _BufferedFileHandler(log_file, encoding="utf-8")
+            self._router.routes[logger_key] = [handler]
+            logger.addHandler(self._queue_handler)
 
             # Store references
             self._loggers[logger_key] = logger
@@ -182,6 +383,9 @@ class LoggingManager:
     ):
         """Log the start of a task with context."""
         logger = self.get_audit_logger(audit_id)
+        # Skip building the record (and sampling memory) if it would be dropped
+        if not logger.isEnabledFor(logging.INFO):
+            return
 
         record = logging.LogRecord(
             name=logger.name,
@@ -216,6 +420,8 @@ class LoggingManager:
         logger = self.get_audit_logger(audit_id)
 
         level = logging.INFO if success else logging.ERROR
+        if not logger.isEnabledFor(level):
+            return
         message = f"Task {'completed' if success else 'failed'}: {task_name}"
 
         record = logging.LogRecord(
@@ -251,6 +457,8 @@ class LoggingManager:
         logger = self.get_audit_logger(audit_id)
 
         level_num = getattr(logging, level.upper(), logging.INFO)
+        if not logger.isEnabledFor(level_num):
+            return
 
         record = logging.LogRecord(
             name=logger.name,
@@ -285,6 +493,8 @@ class LoggingManager:
             self._loggers[logger_key] = logger
 
         level_num = getattr(logging, level.upper(), logging.INFO)
+        if not logger.isEnabledFor(level_num):
+            return
 
         record = logging.LogRecord(
             name=logger.name,
@@ -304,47 +514,78 @@ class LoggingManager:
 
     def _get_worker_id(self) -> str:
         """Get current worker identifier."""
-        try:
-            # Try to get Celery worker info if available
-            import socket
-
-            hostname = socket.gethostname()
-            pid = os.getpid()
-            return f"worker@{hostname}:{pid}"
-        except (OSError, ImportError):
-            return f"worker:{os.getpid()}"
+        if self._worker_id is None:
+            try:
+                # Try to get Celery worker info if available
+                import socket
+
+                hostname = socket.gethostname()
+                pid = os.getpid()
+                self._worker_id = f"worker@{hostname}:{pid}"
+            except (OSError, ImportError):
+                self._worker_id = f"worker:{os.getpid()}"
+        return self._worker_id
 
     def _get_memory_usage(self) -> Optional[float]:
         """Get current memory usage in MB."""
+        now = time.monotonic()
+        sampled_at, memory_mb = self._memory_sample
+        if now - sampled_at < self.MEMORY_SAMPLE_INTERVAL_SECONDS:
+            return memory_mb
         try:
-            process = psutil.Process()
-            return round(process.memory_info().rss / 1024 / 1024, 2)
+            if self._process is None:
+                self._process = psutil.Process()
+            memory_mb = round(self._process.memory_info().rss / 1024 / 1024, 2)
         except (psutil.Error, OSError):
-            return None
+            memory_mb = None
+        self._memory_sample = (now, memory_mb)
+        return memory_mb
 
     def cleanup_audit_logger(self, audit_id: Union[int, str]):
         """Clean up resources for a completed audit logger."""
-        logger_key = f"audit.{audit_id}"
-
         with self._lock:
-            if logger_key in self._handlers:
-                handler = self._handlers[logger_key]
-                handler.close()
-                del self._handlers[logger_key]
+            self._release_audit_logger(f"audit.{audit_id}")
 
-            if logger_key in self._loggers:
-                logger = self._loggers[logger_key]
-                # Remove all handlers
-                for handler in logger.handlers[:]:
-                    handler.close()
-                    logger.removeHandler(handler)
-                del self._loggers[logger_key]
+    def _release_audit_logger(self, logger_key: str):
+        """Detach an audit logger and close its file; the caller holds _lock."""
+        if self._handlers.pop(logger_key, None) is not None:
+            # Closed by the writer thread once the records queued before
+            # this point are written
+            self._queue_handler.enqueue(
+                _CloseRoute(logger_key, self._router.routes[logger_key])
+            )
+
+        logger = self._loggers.pop(logger_key, None)
+        if logger is not None:
+            # The shared queue handler is the only one attached
+            logger.removeHandler(self._queue_handler)
 
 
 # Global instance
 logging_manager = LoggingManager()
 
 
+def _after_fork_in_child():
+    # The logging module gives every handler a fresh lock in the child, so the
+    # locks held over the fork are simply dropped here
+    logging_manager._fork_held_handlers = []
+    logging_manager._worker_id = None
+    logging_manager._process = None
+    logging_manager._memory_sample = LoggingManager._memory_sample
+    logging_manager._restart_listener_in_child()
+
+
+# fork() only exists on POSIX; the Windows worker uses threads or solo
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(
+        before=logging_manager._hold_handlers_for_fork,
+        after_in_parent=logging_manager._release_handlers_after_fork,
+        after_in_child=_after_fork_in_child,
+    )
+# Prefork children call shutdown() from the worker_process_shutdown signal
+atexit.register(logging_manager.shutdown)
+
+
 class TaskLogger:
     """
     Context manager for task logging with automatic timing and cleanup.
@@ -383,17 +624,22 @@ class TaskLogger:
         duration_ms = (time.time() - self.start_time) * 1000
         success = exc_type is None
 
-        # Add exception context if there was an error
+        # Add exception context if there was an error, in a copy so the
+        # caller's context is left as it was
+        context = self.context
         if not success and exc_val:
-            self.context["error"] = str(exc_val)
-            self.context["error_type"] = exc_type.__name__ if exc_type else "Unknown"
+            context = {
+                **context,
+                "error": str(exc_val),
+                "error_type": exc_type.__name__,
+            }
 
         logging_manager.log_task_end(
             audit_id=self.audit_id,
             task_name=self.task_name,
             task_id=self.task_id,
             duration_ms=duration_ms,
-            context=self.context,
+            context=context,
             success=success,
         )
 
@@ -0,0 +1,12 @@
+@echo off
+REM This script activates the virtual environment and starts the Celery beat scheduler.
+
+REM Navigate to the directory where this script is located
+cd /d "%~dp0"
+
+REM Activate the virtual environment
+call .\venv\Scripts\activate.bat
+
+REM Start the Celery beat scheduler
+echo "Starting Celery beat..."
+celery -A app.celery_app.celery_app beat --loglevel=info
\ No newline at end of file
@@ -3,20 +3,70 @@ import sys
 import re
 
 from celery.result import AsyncResult
+from sqlalchemy import text
+from sqlalchemy.orm import defer, load_only
 from app.celery_app import celery_app
 from app.db.session import get_db
 from app.models.audit import Audit
 
 
+# Audit listings only show these; skip the report columns
+RECENT_AUDIT_COLUMNS = load_only(Audit.id, Audit.url, Audit.status, Audit.created_at)
+
+
+# Same document as Audit.full_report_json, assembled and pretty-printed by
+# Postgres so the (large) per-page data is never decoded and re-encoded here
+FULL_REPORT_QUERY = text(
+    """
+    SELECT jsonb_pretty(
+        CASE
+            WHEN page_level_report IS NULL THEN report_json
+            ELSE report_json || jsonb_build_object('page_level_report', page_level_report)
+        END
+    )
+    FROM audits
+    WHERE id = :id
+    """
+)
+
+
 def is_audit_id(identifier: str) -> bool:
     """Check if the identifier looks like an audit ID (integer)"""
     return identifier.isdigit()
 
 
+UUID_PATTERN = re.compile(
+    r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE
+)
+
+
 def is_task_id(identifier: str) -> bool:
     """Check if the identifier looks like a Celery task ID (UUID format)"""
-    uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-    return re.match(uuid_pattern, identifier, re.IGNORECASE) is not None
+    # Every UUID is 36 characters; skip the regex for anything else
+    return len(identifier) == 36 and UUID_PATTERN.match(identifier) is not None
+
+
+def format_link_list(links: list, show_status: bool = False) -> str:
+    """
+    Numbered list of links with their sources, built as one string so a long
+    list is printed with a single write
+    """
+    lines = []
+    for i, link in enumerate(links, 1):
+        lines.append(f"{i}. {link['url']}")
+        # Handle both old single source_url and new source_urls array
+        if 'source_urls' in link:
+            sources = link['source_urls']
+            if len(sources) == 1:
+                lines.append(f"   Source: {sources[0]}")
+            else:
+                lines.append(f"   Sources ({len(sources)}):")
+                lines.extend(f"     {j}. {source}" for j, source in enumerate(sources, 1))
+        else:
+            lines.append(f"   Source: {link.get('source_url', 'Unknown')}")
+        if show_status:
+            lines.append(f"   Status: {link['status']}")
+    return "\n".join(lines)
 
 
 def view_audit_result(audit_id: int):
@@ -27,7 +77,9 @@ def view_audit_result(audit_id: int):
     
     db = next(get_db())
     try:
-        audit = db.query(Audit).filter(Audit.id == audit_id).first()
+        # The per-page data is only needed for the full JSON dump, which
+        # FULL_REPORT_QUERY renders in the database
+        audit = db.get(Audit, audit_id, options=[defer(Audit.page_level_report)])
         if audit:
             print(f"\n--- Audit {audit_id} Found ---")
             print(f"Status: {audit.status}")
@@ -52,37 +104,12 @@ def view_audit_result(audit_id: int):
                 broken_links = audit.report_json.get('internal_broken_links', [])
                 if broken_links:
                     print(f"\n--- Internal Broken Links ({len(broken_links)}) ---")
-                    for i, link in enumerate(broken_links, 1):
-                        print(f"{i}. {link['url']}")
-                        # Handle both old single source_url and new source_urls array
-                        if 'source_urls' in link:
-                            sources = link['source_urls']
-                            if len(sources) == 1:
-                                print(f"   Source: {sources[0]}")
-                            else:
-                                print(f"   Sources ({len(sources)}):")
-                                for j, source in enumerate(sources, 1):
-                                    print(f"     {j}. {source}")
-                        else:
-                            print(f"   Source: {link.get('source_url', 'Unknown')}")
+                    print(format_link_list(broken_links))
                 
                 external_broken = audit.report_json.get('external_broken_links', [])
                 if external_broken:
                     print(f"\n--- External Broken Links ({len(external_broken)}) ---")
-                    for i, link in enumerate(external_broken, 1):
-                        print(f"{i}. {link['url']}")
-                        # Handle both old single source_url and new source_urls array
-                        if 'source_urls' in link:
-                            sources = link['source_urls']
-                            if len(sources) == 1:
-                                print(f"   Source: {sources[0]}")
-                            else:
-                                print(f"   Sources ({len(sources)}):")
-                                for j, source in enumerate(sources, 1):
-                                    print(f"     {j}. {source}")
-                        else:
-                            print(f"   Source: {link.get('source_url', 'Unknown')}")
-                        print(f"   Status: {link['status']}")
+                    print(format_link_list(external_broken, show_status=True))
                 
                 # Option to see full report (non-interactive safe)
                 import sys
@@ -90,7 +117,7 @@ def view_audit_result(audit_id: int):
                     show_full = input("\nShow full report JSON? (y/n): ").lower().strip()
                     if show_full == 'y':
                         print(f"\n--- Full Report JSON ---")
-                        print(json.dumps(audit.report_json, indent=2, default=str))
+                        print(db.execute(FULL_REPORT_QUERY, {"id": audit_id}).scalar())
                 else:
                     print(f"\n--- Run with --full flag for complete JSON ---")
             else:
@@ -98,7 +125,13 @@ def view_audit_result(audit_id: int):
         else:
             print(f"\n--- Audit {audit_id} Not Found ---")
             print("Available audit IDs:")
-            recent_audits = db.query(Audit).order_by(Audit.id.desc()).limit(10).all()
+            recent_audits = (
+                db.query(Audit)
+                .options(RECENT_AUDIT_COLUMNS)
+                .order_by(Audit.id.desc())
+                .limit(10)
+                .all()
+            )
             for audit in recent_audits:
                 print(f"  {audit.id}: {audit.url} ({audit.status}) - {audit.created_at}")
     finally:
@@ -151,7 +184,13 @@ def main():
         print("Recent audits:")
         db = next(get_db())
         try:
-            recent_audits = db.query(Audit).order_by(Audit.id.desc()).limit(20).all()
+            recent_audits = (
+                db.query(Audit)
+                .options(RECENT_AUDIT_COLUMNS)
+                .order_by(Audit.id.desc())
+                .limit(20)
+                .all()
+            )
             for audit in recent_audits:
                 status_emoji = "✅" if audit.status == "COMPLETE" else "❌" if audit.status == "FAILED" else "⏳"
                 print(f"  {status_emoji} {audit.id}: {audit.url} ({audit.status}) - {audit.created_at}")